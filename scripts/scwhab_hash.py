@@ -82,7 +82,7 @@ async def main():
 
         # Insert/update the record in the database using db.py method
         print("Storing account hash in database...")
-        db = DB()
+        db = DB.instance()
         db.insert_account_hash(hash_data)
         print("✅ Account hash stored successfully!")
         print(f"API Name: {schwab.name}")
@@ -3,7 +3,7 @@ import os
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from tools.db import DB
-from tools.schwab import SchwabAPI
+from tools.schwab import SchwabAPI, account_balance_sections
 from tools.config import get_config
 
 """
@@ -34,27 +34,32 @@ TIMEZONE = app_config.get('timezone', 'US/Pacific')
 BALANCE_CHECK_INTERVAL = balance_config.get('check_interval', 10)  # seconds
 BALANCE_COOLDOWN = balance_config.get('cooldown', 60)  # seconds
 
-async def get_balances():
+async def get_balances(schwab):
     """
     Fetch and store account balance data.
 
     Retrieves current account balance information from the Schwab API
     and stores it in the database with timestamp and account details.
+
+    Args:
+        schwab (SchwabAPI): Client shared across balance checks, so its
+            balance cache and in-flight request are reused
     """
     print(f"Fetching Schwab account balance using API: {TRADE_API_NAME}")
 
     try:
-        # Initialize database and API connections
-        db = DB()
-        schwab = SchwabAPI(TRADE_API_NAME)
+        # Initialize database connection
+        db = DB.instance()
         account_data = await schwab.get_account_balance()
 
         if not account_data:
             print("Failed to retrieve account balance.")
             return
 
-        account_info = account_data.get("securitiesAccount", {})
-        balance_info = account_info.get("currentBalances", {})
+        account_info, balance_info = account_balance_sections(account_data)
+        if balance_info is None:
+            print("Account balance response is missing securitiesAccount.currentBalances.")
+            return
 
         # Get current time in configured timezone, remove microseconds for DATETIME2(0)
         proc_time = datetime.now(ZoneInfo(TIMEZONE)).replace(microsecond=0)
@@ -79,12 +84,15 @@ async def get_balances():
         # Re-raise to allow calling code to handle appropriately
         raise
 
-async def scheduler():
+async def scheduler(schwab):
     """
     Schedules balance checks at specific times.
 
     Continuously monitors the current time and triggers balance checks
     when the time matches any of the configured check times.
+
+    Args:
+        schwab (SchwabAPI): Client shared across balance checks
     """
     loop = asyncio.get_running_loop()
 
@@ -104,7 +112,7 @@ async def scheduler():
             print(f"Triggering balance check at {now}")
             try:
                 # Create task to run balance check asynchronously
-                loop.create_task(get_balances())
+                loop.create_task(get_balances(schwab))
                 # Wait cooldown period to prevent multiple runs in the same minute
                 await asyncio.sleep(BALANCE_COOLDOWN)
             except Exception as e:
@@ -131,19 +139,28 @@ async def main():
     print("=" * 40)
 
     try:
-        await scheduler()
+        # One API client for the life of the service, reused by every check
+        async with SchwabAPI(TRADE_API_NAME) as schwab:
+            await scheduler(schwab)
     except KeyboardInterrupt:
         print("\nService stopped by user.")
     except Exception as e:
         print(f"Service error: {str(e)}")
         raise
 
+async def check_once():
+    """
+    Run a single balance check with its own API client.
+    """
+    async with SchwabAPI(TRADE_API_NAME) as schwab:
+        await get_balances(schwab)
+
 def run_once():
     """
     Run a single balance check (useful for testing or manual execution).
     """
     print("Running single balance check...")
-    asyncio.run(get_balances())
+    asyncio.run(check_once())
 
 def run_scheduler():
     """
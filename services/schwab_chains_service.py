@@ -32,7 +32,7 @@ load_dotenv(find_dotenv(), override=True)
 
 from tools.db import DB
 from tools.schwab import SchwabAPI
-from tools.utils import convert_epoch_to_pacific
+from tools.utils import convert_epoch_to_pacific_batch
 from tools.logging_config import init_logging
 
 # Initialize logging
@@ -54,7 +54,7 @@ CHAINS_30MIN_DTE_FROM = int(os.getenv("CHAINS_30MIN_DTE_FROM", "8"))
 CHAINS_30MIN_DTE_TO = int(os.getenv("CHAINS_30MIN_DTE_TO", "30"))
 
 # Initialize database connection
-db = DB()
+db = DB.instance()
 
 def process_options(symbol: str, table: str, option_type_str: str, exp_date_map: dict):
     """
@@ -72,20 +72,22 @@ def process_options(symbol: str, table: str, option_type_str: str, exp_date_map:
     cp_value = 1 if option_type_str == "CALL" else -1
     options_processed = 0
 
+    # Convert every quote time (epoch milliseconds) to Pacific time in one pass
+    quote_times = [
+        option.get("quoteTimeInLong") or None
+        for strikes in exp_date_map.values()
+        for options in strikes.values()
+        for option in options
+    ]
+    dtimes = iter(convert_epoch_to_pacific_batch(quote_times, unit='ms'))
+
     for exp_date, strikes in exp_date_map.items():
         expiry_date = exp_date.split(":")[0]
 
         for strike_price, options in strikes.items():
             for option in options:
+                dtime = next(dtimes)
                 try:
-                    # Convert epoch timestamp to Pacific time
-                    quote_time = option.get("quoteTimeInLong")
-                    if quote_time:
-                        # Convert from milliseconds to seconds for convert_epoch_to_pacific
-                        dtime = convert_epoch_to_pacific(quote_time / 1000)
-                    else:
-                        dtime = None
-
                     weekly = 1 if option.get("optionRoot") == "SPXW" else 0
 
                     data = {
@@ -144,7 +146,8 @@ async def fetch_and_process(symbol: str, table: str, fromDTE: int, toDTE: int, s
     logger.debug(f"Fetching option chains for {symbol} (DTE: {fromDTE}-{toDTE}, Strikes: {strikeCount})")
 
     try:
-        response = await schwab.get_chains(symbol=symbol, fromDTE=fromDTE, toDTE=toDTE, strikeCount=strikeCount)
+        # Multi-day windows are fetched as parallel DTE shards to keep responses small
+        response = await schwab.get_chains_sharded(symbol=symbol, fromDTE=fromDTE, toDTE=toDTE, strikeCount=strikeCount)
 
         # Check for API errors
         if response and isinstance(response, dict) and "fault" in response:
@@ -180,6 +183,8 @@ async def fetch_and_process(symbol: str, table: str, fromDTE: int, toDTE: int, s
 
     except Exception as e:
         logger.error(f"Failed to fetch/process option chains for {symbol}", extra={"error": str(e)})
+    finally:
+        await schwab.aclose()
 
 def scheduled_job():
     """
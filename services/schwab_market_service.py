@@ -44,7 +44,7 @@ MARKET_HOURS_CHECK_INTERVAL = int(os.getenv("MARKET_HOURS_CHECK_INTERVAL", "60")
 TRADE_API_NAME = os.getenv("TRADE_API_NAME", "MAIN_TRADE")
 
 # Initialize DB and API clients
-db = DB()
+db = DB.instance()
 client = SchwabAPI(TRADE_API_NAME)
 
 def upsert_market_hours_for_today():
@@ -44,7 +44,7 @@ OHLC_CHECK_INTERVAL = ohlc_config.get("check_interval", 60)  # seconds
 OHLC_STORED_PROCEDURE = ohlc_config.get("stored_procedure", "PYTHON.SP_PY_PROCESS_OHLC")
 
 # Initialize database and API connection
-db = DB()
+db = DB.instance()
 schwab = SchwabAPI(OHLC_API_NAME)
 
 async def run_daily_task():
@@ -62,23 +62,21 @@ async def run_daily_task():
         # Ensure tokens are up to date
         await schwab.token_handler()
 
-        # Fetch minute-level OHLC data for all symbols
+        symbols = [symbol.strip() for symbol in OHLC_SYMBOLS]  # Remove any whitespace
+
+        # Fetch minute-level OHLC data for all symbols (concurrently, one insert)
         logger.info("Fetching minute-level OHLC data...")
-        for symbol in OHLC_SYMBOLS:
-            symbol = symbol.strip()  # Remove any whitespace
-            try:
-                await schwab.get_historic_quote_to_sql_minute(symbol)
-            except Exception as e:
-                logger.error(f"Failed to fetch minute data for {symbol}", extra={"error": str(e)})
+        try:
+            await schwab.get_historic_quotes_to_sql_minute(symbols)
+        except Exception as e:
+            logger.error("Failed to store minute data", extra={"error": str(e)})
 
         # Fetch daily OHLC data for all symbols
         logger.info("Fetching daily OHLC data...")
-        for symbol in OHLC_SYMBOLS:
-            symbol = symbol.strip()  # Remove any whitespace
-            try:
-                await schwab.get_historic_quote_to_sql_day(symbol)
-            except Exception as e:
-                logger.error(f"Failed to fetch daily data for {symbol}", extra={"error": str(e)})
+        try:
+            await schwab.get_historic_quotes_to_sql_day(symbols)
+        except Exception as e:
+            logger.error("Failed to store daily data", extra={"error": str(e)})
 
         # Process staging table using stored procedure
         logger.info(f"Processing data with stored procedure: {OHLC_STORED_PROCEDURE}")
@@ -1,14 +1,14 @@
 # tools/schwab_stream.py
 
 import json, time, threading, websocket, logging, os, sys
-from datetime import date, datetime
+from datetime import date, datetime, time as dt_time
 # Add project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 
 from tools.db             import DB
-from tools.redis_cache    import set_latest_quote
+from tools.redis_cache    import set_latest_quote, set_latest_quotes
 from tools.parquet_writer import ParquetWriter
 from tools.schwab         import SchwabAPI, generate_spxw_symbols
 
@@ -50,7 +50,7 @@ class SchwabStream:
         self.client = SchwabAPI(API_DATA_NAME, data_name=API_DATA_NAME, trade_name=API_TRADE_NAME)
 
         # Initialize database connection for token retrieval
-        self.db = DB()
+        self.db = DB.instance()
 
         # Fetch streamerInfo via TRADE token
         try:
@@ -85,7 +85,6 @@ class SchwabStream:
 
     def _calculate_end_time(self):
         """Calculate today's end time (13:00 PM) as timestamp."""
-        from datetime import time as dt_time
         today = datetime.now().date()
         end_time = dt_time(13, 0)  # 13:00 PM
         end_datetime = datetime.combine(today, end_time)
@@ -299,18 +298,21 @@ class SchwabStream:
                 continue
 
             if service == "LEVELONE_OPTIONS":
+                quotes = {}
                 for content in blk.get("content", []):
                     key = content.get("key")
                     if content.get("37") is None:
                         continue
                     self.last_msg_ts = time.time()
-                    set_latest_quote(key, json.dumps(content))
+                    quotes[key] = json.dumps(content)
                     record = {
                         "received_at": int(self.last_msg_ts * 1000),
                         "symbol":      key,
                         **{k: content[k] for k in content if k != "key"}
                     }
                     self.parquet_writer.write(record)
+                # One Redis round-trip for the whole options block
+                set_latest_quotes(quotes)
 
             elif service == "LEVELONE_EQUITIES":
                 for content in blk.get("content", []):
@@ -74,7 +74,7 @@ class SchwabStreamController:
         self.monitor_running = False
 
         # Initialize database connection
-        self.db = DB()
+        self.db = DB.instance()
 
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
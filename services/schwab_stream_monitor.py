@@ -105,15 +105,17 @@ def check_parquet():
       spxw_count_parquet (int): number of SPXW records in today's parquet updated within PARQUET_FRESHNESS seconds
     """
     today_str = datetime.now().strftime("%Y-%m-%d")
-    filename = f"quotes_{today_str}.parquet"
-    path = os.path.join(PARQUET_DIR, filename)
+    # While the stream is running, today's data lives in part files under
+    # quotes_<date>/; the single quotes_<date>.parquet only exists after compaction.
+    parts_dir = os.path.join(PARQUET_DIR, f"quotes_{today_str}")
+    path = parts_dir if os.path.isdir(parts_dir) else f"{parts_dir}.parquet"
     now_ms = int(time.time() * 1000)
 
     if not os.path.exists(path):
         return False, 0
 
     try:
-        df = pd.read_parquet(path)
+        df = pd.read_parquet(path, columns=["symbol", "received_at"])
     except Exception:
         return False, 0
 
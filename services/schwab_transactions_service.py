@@ -50,20 +50,44 @@ TRANSACTIONS_NO_ORDERS_LOG_INTERVAL = int(os.getenv("TRANSACTIONS_NO_ORDERS_LOG_
 # Global variable to track when we last logged "no orders received"
 last_no_orders_print_time = 0
 
-async def run_transaction_processing():
+def store_order(db, order):
+    """
+    Store one order's raw JSON and structured rows.
+
+    Runs in a worker thread so several orders can be written at once.
+
+    Returns:
+        bool: True if the order was stored, False if it failed (error is logged)
+    """
+    try:
+        # Store raw JSON data
+        db.insert_raw_json(order)
+
+        # Process structured order data
+        db.process_order(order)
+        return True
+
+    except Exception as e:
+        order_id = order.get('orderId', 'UNKNOWN')
+        logger.error(f"Failed to process order {order_id}", extra={"error": str(e)})
+        return False
+
+async def run_transaction_processing(schwab):
     """
     Fetch and process Schwab transactions.
 
     Retrieves orders from the last 24 hours, stores raw JSON data,
     processes structured data, and executes the stored procedure.
+
+    Args:
+        schwab (SchwabAPI): Client shared across processing runs
     """
     global last_no_orders_print_time
     current_time = time.time()
 
     try:
-        # Initialize database and API connections
-        db = DB()
-        schwab = SchwabAPI(TRANSACTIONS_API_NAME)
+        # Initialize database connection
+        db = DB.instance()
 
         # Use the cached account hash loaded during initialization
         account_hash = schwab.account_hash
@@ -91,20 +115,17 @@ async def run_transaction_processing():
 
         logger.info(f"Processing {len(orders_dump)} orders")
 
-        # Process each order
-        orders_processed = 0
-        for order in orders_dump:
-            try:
-                # Store raw JSON data
-                db.insert_raw_json(order)
+        # Process orders concurrently; each order is independent and runs in its
+        # own transaction on its own pooled connection (DB.process_order re-runs
+        # a transaction that loses a deadlock)
+        limit = asyncio.Semaphore(db.config['pool_size'])
 
-                # Process structured order data
-                db.process_order(order)
-                orders_processed += 1
+        async def store(order):
+            async with limit:
+                return await asyncio.to_thread(store_order, db, order)
 
-            except Exception as e:
-                order_id = order.get('orderId', 'UNKNOWN')
-                logger.error(f"Failed to process order {order_id}", extra={"error": str(e)})
+        results = await asyncio.gather(*(store(order) for order in orders_dump))
+        orders_processed = sum(results)
 
         # Execute stored procedure to process the data
         try:
@@ -146,12 +167,15 @@ def is_market_hours():
     return market_open <= now <= market_close
 
 
-async def scheduler():
+async def scheduler(schwab):
     """
     Run transaction processing with different intervals based on market hours.
 
     Processes transactions every 10 seconds during market hours (weekdays 6:30 AM - 1:00 PM)
     and every 60 seconds outside market hours.
+
+    Args:
+        schwab (SchwabAPI): Client shared across processing runs
     """
     logger.info("Starting transaction processing scheduler")
     logger.info(f"Market hours: {TRANSACTIONS_MARKET_START_HOUR:02d}:{TRANSACTIONS_MARKET_START_MINUTE:02d} - {TRANSACTIONS_MARKET_END_HOUR:02d}:{TRANSACTIONS_MARKET_END_MINUTE:02d} (weekdays)")
@@ -161,11 +185,11 @@ async def scheduler():
         try:
             if is_market_hours():
                 # During market hours - process frequently
-                await run_transaction_processing()
+                await run_transaction_processing(schwab)
                 await asyncio.sleep(TRANSACTIONS_ACTIVE_INTERVAL)
             else:
                 # Outside market hours - process less frequently
-                await run_transaction_processing()
+                await run_transaction_processing(schwab)
                 await asyncio.sleep(TRANSACTIONS_INACTIVE_INTERVAL)
 
         except KeyboardInterrupt:
@@ -187,13 +211,15 @@ async def main():
     logger.info(f"Account: {ACCNT_NUM}")
     logger.info(f"Stored procedure: {TRANSACTIONS_STORED_PROCEDURE}")
 
-    # Run initial transaction processing
-    logger.info("Running initial transaction processing...")
-    await run_transaction_processing()
+    # One API client for the life of the service, reused by every run
+    async with SchwabAPI(TRANSACTIONS_API_NAME) as schwab:
+        # Run initial transaction processing
+        logger.info("Running initial transaction processing...")
+        await run_transaction_processing(schwab)
 
-    # Start the continuous scheduler
-    logger.info("Starting continuous transaction monitoring...")
-    await scheduler()
+        # Start the continuous scheduler
+        logger.info("Starting continuous transaction monitoring...")
+        await scheduler(schwab)
 
 
 if __name__ == "__main__":
@@ -42,6 +42,10 @@ async def monitor_tokens(refresh_threshold=REFRESH_THRESHOLD):
     api_data = SchwabAPI(DATA_API_NAME)
     api_trade = None if SINGLE_API_MODE else SchwabAPI(TRADE_API_NAME)
 
+    # Renew access tokens ahead of expiry; the loop below is the fallback
+    api_data.start_background_refresh()
+    api_trade.start_background_refresh() if not SINGLE_API_MODE else None
+
     while True:
         current_time = time.time()
         current_time_str = datetime.fromtimestamp(current_time).strftime('%H:%M:%S')
@@ -72,7 +72,7 @@ CREATE TABLE [PYTHON].[EXECUTIONLEGS]
 (
 	[activityId] ASC,
 	[legId] ASC
-)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = ON, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
 ) ON [PRIMARY]
 GO
 
@@ -111,6 +111,15 @@ CREATE TABLE [PYTHON].[ORDERACTIVITIES]
 )WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
 ) ON [PRIMARY]
 GO
+CREATE UNIQUE NONCLUSTERED INDEX [UX_OrderActivities] ON [PYTHON].[ORDERACTIVITIES]
+(
+	[orderId] ASC,
+	[activityType] ASC,
+	[executionType] ASC,
+	[quantity] ASC,
+	[orderRemainingQuantity] ASC
+)WITH (IGNORE_DUP_KEY = ON) ON [PRIMARY]
+GO
 
 SET ANSI_NULLS ON
 GO
@@ -134,6 +143,12 @@ CREATE TABLE [PYTHON].[ORDERLEGS]
 	[quantity] [float] NULL
 ) ON [PRIMARY]
 GO
+CREATE UNIQUE NONCLUSTERED INDEX [UX_OrderLegs_orderId_legId] ON [PYTHON].[ORDERLEGS]
+(
+	[orderId] ASC,
+	[legId] ASC
+)WITH (IGNORE_DUP_KEY = ON) ON [PRIMARY]
+GO
 
 SET ANSI_NULLS ON
 GO
@@ -165,7 +180,7 @@ CREATE TABLE [PYTHON].[ORDERS]
 	CONSTRAINT [PK_Orders] PRIMARY KEY CLUSTERED 
 (
 	[orderId] ASC
-)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = ON, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
 ) ON [PRIMARY]
 GO
 
@@ -256,6 +271,13 @@ CREATE TABLE [SCHWAB].[JSON_TRANSACTIONS]
 	[enteredTime] [datetime] NULL
 ) ON [PRIMARY] TEXTIMAGE_ON [PRIMARY]
 GO
+CREATE UNIQUE NONCLUSTERED INDEX [UX_JsonTransactions_OrderID_Status_enteredTime] ON [SCHWAB].[JSON_TRANSACTIONS]
+(
+	[OrderID] ASC,
+	[Status] ASC,
+	[enteredTime] ASC
+)WITH (IGNORE_DUP_KEY = ON) ON [PRIMARY]
+GO
 
 SET ANSI_NULLS ON
 GO
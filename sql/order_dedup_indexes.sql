@@ -0,0 +1,40 @@
+USE [OPT]
+GO
+-- ============================================================
+-- Duplicate-ignoring unique keys for the order tables
+--
+-- tools/db.py writes orders, legs, activities, execution legs
+-- and raw JSON with plain INSERTs and relies on these keys to
+-- drop rows that already exist ("Duplicate key was ignored." is a warning, not
+-- an error). Run once against databases created from an older
+-- opt.sql; new installs get the same keys from opt.sql.
+-- ============================================================
+
+-- Existing primary keys: switch duplicates from error to ignore
+ALTER INDEX [PK_Orders] ON [PYTHON].[ORDERS] SET (IGNORE_DUP_KEY = ON)
+GO
+ALTER INDEX [PK_ExecutionLegs] ON [PYTHON].[EXECUTIONLEGS] SET (IGNORE_DUP_KEY = ON)
+GO
+
+-- Tables without a key: add one matching the application's duplicate check
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'UX_OrderLegs_orderId_legId')
+    CREATE UNIQUE NONCLUSTERED INDEX [UX_OrderLegs_orderId_legId]
+    ON [PYTHON].[ORDERLEGS] ([orderId] ASC, [legId] ASC)
+    WITH (IGNORE_DUP_KEY = ON)
+GO
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'UX_JsonTransactions_OrderID_Status_enteredTime')
+    CREATE UNIQUE NONCLUSTERED INDEX [UX_JsonTransactions_OrderID_Status_enteredTime]
+    ON [SCHWAB].[JSON_TRANSACTIONS] ([OrderID] ASC, [Status] ASC, [enteredTime] ASC)
+    WITH (IGNORE_DUP_KEY = ON)
+GO
+
+-- Activity key: lets the activity insert find existing rows with a seek
+-- and settles concurrent inserts of one activity without range locks.
+-- Remove any duplicate activities (and re-point their ExecutionLegs)
+-- before creating it.
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'UX_OrderActivities')
+    CREATE UNIQUE NONCLUSTERED INDEX [UX_OrderActivities]
+    ON [PYTHON].[ORDERACTIVITIES] ([orderId] ASC, [activityType] ASC, [executionType] ASC, [quantity] ASC, [orderRemainingQuantity] ASC)
+    WITH (IGNORE_DUP_KEY = ON)
+GO
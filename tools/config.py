@@ -184,7 +184,9 @@ class Config:
             'host': host,
             'port': db_config.get('port', 1433),
             'database': db_config.get('database_name', 'OPT'),
-            'driver': db_config.get('driver', 'ODBC Driver 17 for SQL Server')
+            'driver': db_config.get('driver', 'ODBC Driver 17 for SQL Server'),
+            'pool_size': db_config.get('pool_size', 5),
+            'pool_recycle': db_config.get('pool_recycle', 3600)
         }
     
     def get_email_config(self) -> Dict[str, Any]:
@@ -225,7 +227,8 @@ class Config:
             'trade_name': api_config.get('trade_name', 'MAIN_TRADE'),
             'max_retries': schwab_config.get('max_retries', 30),
             'initial_retry_delay': schwab_config.get('initial_retry_delay', 1),
-            'http_timeout': schwab_config.get('http_timeout', 10)
+            'http_timeout': schwab_config.get('http_timeout', 10),
+            'max_response_bytes': schwab_config.get('max_response_bytes', 50_000_000)
         }
     
     def reload(self):
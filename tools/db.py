@@ -15,6 +15,8 @@ Features:
 Dependencies:
 - sqlalchemy: For database ORM and connection management
 - pyodbc: For SQL Server connectivity (via ODBC Driver 17)
+- pandas: For DataFrame reads and writes
+- turbodbc (optional): For Arrow-backed bulk reads in read_sql()
 - tools.config: For centralized configuration management
 
 Security:
@@ -24,11 +26,248 @@ Security:
 """
 
 import os
+import json
 import time
-from sqlalchemy import create_engine, text
+import random
+import functools
+from datetime import date, timezone
+from contextlib import contextmanager
+import pandas as pd
+import pyodbc
+from sqlalchemy import BigInteger, Date, DateTime, Float, Integer, String, UnicodeText, bindparam, create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine import URL
 from tools.config import get_config
+from tools.utils import parse_date, convert_to_pacific_time
+
+try:
+    # Optional: Arrow-backed bulk fetch for read_sql(use_arrow=True)
+    import turbodbc
+except ImportError:
+    turbodbc = None
+
+
+# Strings longer than this are bound as NVARCHAR(MAX) rather than NVARCHAR(n)
+_MAX_NVARCHAR_LENGTH = 4000
+
+# Times an order transaction chosen as a deadlock victim is re-run
+_DEADLOCK_RETRIES = 3
+
+
+def _is_deadlock(exc: BaseException) -> bool:
+    """True if exc (or an exception it wraps) is SQL Server deadlock error 1205."""
+    while exc is not None:
+        if isinstance(exc, pyodbc.Error) and (exc.args[:1] == ('40001',) or '(1205)' in str(exc)):
+            return True
+        exc = exc.__cause__ or getattr(exc, 'orig', None)
+    return False
+
+
+def _set_input_sizes(conn, cursor, statement, parameters, context, executemany):
+    """
+    Bind fixed input sizes for executemany() batches.
+
+    Without hints pyodbc infers each parameter's type and size from the first
+    row and re-prepares the statement whenever a later row holds a longer
+    string (e.g. variable-length order JSON). String columns are bound as
+    NVARCHAR(4000), or NVARCHAR(MAX) if any value is longer, rather than at
+    the batch's widest value, so every batch declares the same parameter
+    types and SQL Server reuses one cached plan.
+
+    Registered as a SQLAlchemy "before_cursor_execute" engine event.
+    """
+    if not executemany or not parameters or not isinstance(parameters[0], (list, tuple)):
+        return
+
+    sizes = []
+    for column in zip(*parameters):
+        lengths = [len(value) for value in column if isinstance(value, str)]
+        if not lengths:
+            sizes.append(None)
+        elif max(lengths) > _MAX_NVARCHAR_LENGTH:
+            sizes.append((pyodbc.SQL_WLONGVARCHAR, 0, 0))
+        else:
+            sizes.append((pyodbc.SQL_WVARCHAR, _MAX_NVARCHAR_LENGTH, 0))
+
+    if any(sizes):
+        cursor.setinputsizes(sizes)
+
+
+def _as_text(query):
+    """Wrap a SQL string in text(); pre-built TextClause objects pass through unchanged."""
+    return text(query) if isinstance(query, str) else query
+
+
+def _to_str(value):
+    """Convert Schwab numeric IDs to str to match NVARCHAR columns; None passes through."""
+    return None if value is None else str(value)
+
+
+# ─── Order statements (used by DB.insert_raw_json / DB.process_order) ───────
+# Built once at import so every call reuses the same statement object (and
+# SQLAlchemy's compiled cache); typed binds match the target column types so
+# SQL Server sees consistent parameter types and reuses one cached plan.
+
+# Plain INSERTs: duplicates are dropped by the IGNORE_DUP_KEY unique keys on
+# each table (see sql/order_dedup_indexes.sql), so the common non-duplicate
+# path is a single index seek + insert with no separate existence probe
+_INSERT_RAW_JSON_SQL = text("""
+    INSERT INTO OPT.SCHWAB.JSON_TRANSACTIONS (OrderID, Status, enteredTime, JsonData)
+    VALUES (:orderId, :status, :enteredTime, :jsonData);
+""").bindparams(
+    bindparam("orderId", type_=BigInteger),
+    bindparam("status", type_=String(50)),
+    bindparam("enteredTime", type_=String),
+    bindparam("jsonData", type_=UnicodeText),
+)
+
+_INSERT_ORDER_SQL = text("""
+    INSERT INTO PYTHON.Orders (orderId, session, duration, orderType, complexOrderStrategyType, quantity, filledQuantity,
+                               remainingQuantity, requestedDestination, destinationLinkName, stopPrice, stopType,
+                               orderStrategyType, cancelable, editable, status, enteredTime, closeTime, tag, accountNumber, parentOrderId)
+    VALUES (:orderId, :session, :duration, :orderType, :complexOrderStrategyType, :quantity, :filledQuantity,
+            :remainingQuantity, :requestedDestination, :destinationLinkName, :stopPrice, :stopType,
+            :orderStrategyType, :cancelable, :editable, :status, :enteredTime, :closeTime, :tag, :accountNumber, :parentOrderId);
+""").bindparams(
+    bindparam("orderId", type_=String(50)),
+    bindparam("session", type_=String(50)),
+    bindparam("duration", type_=String(50)),
+    bindparam("orderType", type_=String(50)),
+    bindparam("complexOrderStrategyType", type_=String(50)),
+    bindparam("quantity", type_=Float),
+    bindparam("filledQuantity", type_=Float),
+    bindparam("remainingQuantity", type_=Float),
+    bindparam("requestedDestination", type_=String(50)),
+    bindparam("destinationLinkName", type_=String(50)),
+    bindparam("stopPrice", type_=Float),
+    bindparam("stopType", type_=String(50)),
+    bindparam("orderStrategyType", type_=String(50)),
+    bindparam("status", type_=String(50)),
+    bindparam("enteredTime", type_=String),
+    bindparam("closeTime", type_=String),
+    bindparam("tag", type_=String(50)),
+    bindparam("accountNumber", type_=String(50)),
+    bindparam("parentOrderId", type_=String(50)),
+)
+
+_INSERT_ORDER_LEG_SQL = text("""
+    INSERT INTO PYTHON.OrderLegs (legId, orderId, orderLegType, assetType, cusip, symbol, description, instrumentId, type,
+                                  putCall, underlyingSymbol, instruction, positionEffect, quantity)
+    VALUES (:legId, :orderId, :orderLegType, :assetType, :cusip, :symbol, :description, :instrumentId, :type,
+            :putCall, :underlyingSymbol, :instruction, :positionEffect, :quantity);
+""").bindparams(
+    bindparam("legId", type_=String(50)),
+    bindparam("orderId", type_=String(50)),
+    bindparam("orderLegType", type_=String(50)),
+    bindparam("assetType", type_=String(50)),
+    bindparam("cusip", type_=String(50)),
+    bindparam("symbol", type_=String(50)),
+    bindparam("description", type_=String(255)),
+    bindparam("instrumentId", type_=String(50)),
+    bindparam("type", type_=String(50)),
+    bindparam("putCall", type_=String(50)),
+    bindparam("underlyingSymbol", type_=String(50)),
+    bindparam("instruction", type_=String(50)),
+    bindparam("positionEffect", type_=String(50)),
+    bindparam("quantity", type_=Float),
+)
+
+# Order / leg fields copied straight from the Schwab payload (missing -> None).
+# Row builders fetch them with map(dict.get, ...) instead of one .get() per key;
+# the remaining columns need conversion and are set individually.
+_ORDER_PASSTHROUGH_FIELDS = (
+    "session", "duration", "orderType", "complexOrderStrategyType", "quantity", "filledQuantity",
+    "remainingQuantity", "requestedDestination", "destinationLinkName", "stopPrice", "stopType",
+    "orderStrategyType", "cancelable", "editable", "status", "tag", "accountNumber",
+)
+_ORDER_LEG_PASSTHROUGH_FIELDS = ("orderLegType", "instruction", "positionEffect", "quantity")
+_INSTRUMENT_PASSTHROUGH_FIELDS = ("assetType", "cusip", "symbol", "description", "type", "putCall", "underlyingSymbol")
+
+# Activity columns in batch source order; all of them form the duplicate key
+_ACTIVITY_COLUMNS = ("orderId", "activityType", "executionType", "quantity", "orderRemainingQuantity")
+
+# Rows per activity batch; keeps each batch under SQL Server's 2100-parameter limit
+_ACTIVITY_BATCH = 300
+
+
+# Null-safe match of a target activity row on the full activity key; served
+# by the UX_OrderActivities unique index
+_ACTIVITY_MATCH = " AND ".join(
+    f"(target.{column} = source.{column} OR (target.{column} IS NULL AND source.{column} IS NULL))"
+    for column in _ACTIVITY_COLUMNS
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _merge_activities_sql(row_count: int):
+    """
+    Build the OrderActivities insert-and-lookup batch for row_count activities.
+
+    The batch loads the rows (each tagged with its batch index, idx) into a
+    table variable, inserts the ones not yet stored, and returns
+    (idx, activityId) for every row with one keyed SELECT. Existing rows are
+    only read, never rewritten. Concurrent writers of the same key are
+    resolved by the IGNORE_DUP_KEY unique index rather than range locks.
+    Cached per row count so repeated batch sizes reuse one statement and plan.
+    """
+    values = ",\n               ".join(
+        "(" + ", ".join(f":{column}_{i}" for column in ("idx",) + _ACTIVITY_COLUMNS) + ")"
+        for i in range(row_count)
+    )
+    return text(f"""
+        DECLARE @source TABLE (
+            idx INT, orderId NVARCHAR(50), activityType NVARCHAR(50), executionType NVARCHAR(50),
+            quantity FLOAT, orderRemainingQuantity FLOAT
+        );
+        INSERT INTO @source (idx, orderId, activityType, executionType, quantity, orderRemainingQuantity)
+        VALUES {values};
+
+        INSERT INTO PYTHON.OrderActivities (orderId, activityType, executionType, quantity, orderRemainingQuantity)
+        SELECT source.orderId, source.activityType, source.executionType, source.quantity, source.orderRemainingQuantity
+        FROM @source AS source
+        WHERE NOT EXISTS (SELECT 1 FROM PYTHON.OrderActivities AS target WHERE {_ACTIVITY_MATCH});
+
+        SELECT source.idx, target.activityId
+        FROM @source AS source
+        JOIN PYTHON.OrderActivities AS target ON {_ACTIVITY_MATCH};
+    """)
+
+
+_INSERT_EXECUTION_LEG_SQL = text("""
+    INSERT INTO PYTHON.ExecutionLegs (activityId, legId, quantity, mismarkedQuantity, price, time, instrumentId)
+    VALUES (:activityId, :legId, :quantity, :mismarkedQuantity, :price, :time, :instrumentId);
+""").bindparams(
+    bindparam("activityId", type_=Integer),
+    bindparam("legId", type_=String(50)),
+    bindparam("quantity", type_=Float),
+    bindparam("mismarkedQuantity", type_=Float),
+    bindparam("price", type_=Float),
+    bindparam("instrumentId", type_=String(50)),
+)
+
+
+# ─── OHLC staging inserts (used by DB.insert_candles) ───────────────────────
+_CANDLE_BINDS = (
+    bindparam("open", type_=Float),
+    bindparam("high", type_=Float),
+    bindparam("low", type_=Float),
+    bindparam("close", type_=Float),
+    bindparam("volume", type_=BigInteger),
+    bindparam("datetime", type_=DateTime),
+    bindparam("Symbol", type_=String),
+    bindparam("freq", type_=String),
+)
+
+_INSERT_CANDLES_SQL = {
+    'MINUTE': text("""
+        INSERT INTO PYTHON.MINUTE ([open], [high], [low], [close], [volume], [datetime], [Symbol], [freq])
+        VALUES (:open, :high, :low, :close, :volume, :datetime, :Symbol, :freq);
+    """).bindparams(*_CANDLE_BINDS),
+    'DAY': text("""
+        INSERT INTO PYTHON.DAY ([open], [high], [low], [close], [volume], [datetime], [date], [Symbol], [freq])
+        VALUES (:open, :high, :low, :close, :volume, :datetime, :date, :Symbol, :freq);
+    """).bindparams(*_CANDLE_BINDS, bindparam("date", type_=Date)),
+}
 
 
 class DB:
@@ -53,6 +292,9 @@ class DB:
         SQL_DATABASE: Database name (default: 'OPT')
         SQL_DRIVER: ODBC driver name (default: 'ODBC Driver 17 for SQL Server')
     """
+    # Process-wide shared instance, created lazily by DB.instance()
+    _singleton = None
+
     def __init__(self):
         """
         Initialize the database connection.
@@ -65,7 +307,8 @@ class DB:
             Exception: If database connection cannot be established
         """
         # Load database configuration from centralized config system
-        self._load_config()
+        config = get_config()
+        self._load_config(config)
 
         # Create SQLAlchemy connection URL
         self.connection_url = URL.create(
@@ -82,26 +325,59 @@ class DB:
             },
         )
 
-        # Create database engine and session factory
-        self.engine = create_engine(self.connection_url)
+        # Create database engine with a pre-pinged, recycled connection pool;
+        # fast_executemany sends batched parameter rows in a single ODBC call
+        pool_size = self.config['pool_size']
+        self.engine = create_engine(
+            self.connection_url,
+            pool_size=pool_size,
+            max_overflow=2 * pool_size,
+            pool_recycle=self.config['pool_recycle'],
+            pool_pre_ping=True,
+            fast_executemany=True,
+        )
         self.Session = sessionmaker(bind=self.engine)
+
+        # Bind fixed parameter sizes for batched statements (see _set_input_sizes)
+        event.listen(self.engine, "before_cursor_execute", _set_input_sizes)
         self._persistent_connection = None
 
         # Load market hours configuration for get_next_session method
-        self._load_market_hours_config()
+        self._load_market_hours_config(config)
 
-    def _load_config(self):
+    @classmethod
+    def instance(cls) -> "DB":
+        """
+        Get the shared process-wide DB instance.
+
+        Creates the instance on first use and returns the same object on every
+        subsequent call, so the engine, connection pool and configuration are
+        only built once per process.
+
+        Returns:
+            DB: The shared database instance
+
+        Example:
+            db = DB.instance()
+            token = db.get_token('MAIN_DATA')
+        """
+        if cls._singleton is None:
+            cls._singleton = cls()
+        return cls._singleton
+
+    def _load_config(self, config):
         """
         Load and validate database configuration from centralized config system.
 
         Uses the centralized configuration manager to load database settings,
         combining secrets from .env with configuration from config.yaml.
 
+        Args:
+            config (Config): Centralized configuration instance
+
         Raises:
             ValueError: If required database credentials are missing
         """
-        # Get configuration from centralized config system
-        config = get_config()
         self.config = config.get_database_config()
 
     def get_session(self, persistent=False):
@@ -131,7 +407,66 @@ class DB:
             # Return new transient session
             return self.Session()
 
-    def execute_query(self, query, params=None, persistent=False):
+    @contextmanager
+    def session_scope(self):
+        """
+        Provide a transactional session scope for a series of operations.
+
+        Yields a single session that callers can pass to execute_query(),
+        execute_query_rows(), execute_scalars() and execute_non_query() via
+        their session argument, so a burst of small queries shares one
+        session and connection checkout. Commits on success, rolls back on
+        any exception, and always closes the session.
+
+        Yields:
+            Session: SQLAlchemy session owned by the scope
+
+        Example:
+            with db.session_scope() as session:
+                token = db.execute_scalars(token_query, params, session=session)
+                db.execute_non_query(update_query, params, session=session)
+        """
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @contextmanager
+    def transaction_scope(self):
+        """
+        Provide a session whose statements run in one explicit transaction.
+
+        Connections are opened with autocommit enabled, so each statement
+        normally commits on its own. This scope pins a single pooled
+        connection (via session_scope()) and wraps everything executed on it
+        in BEGIN/COMMIT TRANSACTION, rolling back if an exception escapes.
+        SET NOCOUNT ON suppresses the per-statement row-count messages.
+
+        Yields:
+            Session: SQLAlchemy session bound to the open transaction
+
+        Example:
+            with db.transaction_scope() as session:
+                db.execute_non_query(insert_parent, parent_params, session=session)
+                db.execute_non_query(insert_children, child_rows, session=session)
+        """
+        with self.session_scope() as session:
+            session.execute(text("SET NOCOUNT ON; BEGIN TRANSACTION;"))
+            try:
+                yield session
+                session.execute(text("COMMIT TRANSACTION;"))
+            except Exception:
+                session.execute(text("IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;"))
+                raise
+            finally:
+                session.execute(text("SET NOCOUNT OFF;"))
+
+    def execute_query(self, query, params=None, persistent=False, session=None):
         """
         Execute a SELECT query and return results.
 
@@ -139,9 +474,11 @@ class DB:
         Automatically handles session management based on persistence setting.
 
         Args:
-            query (str): SQL query string (can contain named parameters like :param_name)
+            query (str | TextClause): SQL query string (can contain named parameters like :param_name)
             params (dict, optional): Dictionary of parameter values for the query
             persistent (bool): Whether to use a persistent session (default: False)
+            session (Session, optional): Caller-owned session (e.g. from session_scope());
+                                       when given, it is used as-is and not closed
 
         Returns:
             list: List of Row objects containing query results
@@ -155,17 +492,95 @@ class DB:
         Security:
             Uses parameterized queries to prevent SQL injection attacks.
         """
+        if session is not None:
+            return session.execute(_as_text(query), params).fetchall()
+
         session = self.get_session(persistent)
         try:
             # Execute parameterized query for security
-            result = session.execute(text(query), params).fetchall()
+            result = session.execute(_as_text(query), params).fetchall()
             return result
         finally:
             # Clean up transient sessions automatically
             if not persistent:
                 session.close()
 
-    def execute_non_query(self, query, params=None, persistent=False):
+    def execute_query_rows(self, query, params=None, persistent=False, as_dict=False, session=None):
+        """
+        Execute a SELECT query and return lightweight rows.
+
+        Variant of execute_query() for bulk reads where per-row Row wrappers
+        are not needed. Rows are returned either as plain tuples (in SELECT
+        column order) or as read-only dict-like mappings keyed by column name.
+
+        Args:
+            query (str | TextClause): SQL query string (can contain named parameters like :param_name)
+            params (dict, optional): Dictionary of parameter values for the query
+            persistent (bool): Whether to use a persistent session (default: False)
+            as_dict (bool): If True, return RowMapping objects instead of tuples
+            session (Session, optional): Caller-owned session (e.g. from session_scope());
+                                       when given, it is used as-is and not closed
+
+        Returns:
+            list: List of tuples, or list of RowMapping objects if as_dict is True
+
+        Example:
+            rows = db.execute_query_rows(
+                "SELECT market_date, is_open FROM OPT.SCHWAB.MARKET_HOURS"
+            )
+            for market_date, is_open in rows:
+                ...
+        """
+        if session is not None:
+            return self._rows(session.execute(_as_text(query), params), as_dict)
+
+        session = self.get_session(persistent)
+        try:
+            return self._rows(session.execute(_as_text(query), params), as_dict)
+        finally:
+            # Clean up transient sessions automatically
+            if not persistent:
+                session.close()
+
+    @staticmethod
+    def _rows(result, as_dict):
+        """Materialize a result as RowMappings or plain tuples."""
+        if as_dict:
+            return result.mappings().all()
+        return [tuple(row) for row in result]
+
+    def execute_scalars(self, query, params=None, persistent=False, session=None):
+        """
+        Execute a single-column SELECT query and return the column values.
+
+        Args:
+            query (str): SQL query string selecting one column
+            params (dict, optional): Dictionary of parameter values for the query
+            persistent (bool): Whether to use a persistent session (default: False)
+            session (Session, optional): Caller-owned session (e.g. from session_scope());
+                                       when given, it is used as-is and not closed
+
+        Returns:
+            list: Values of the first column, one per row
+
+        Example:
+            tokens = db.execute_scalars(
+                "SELECT access_token FROM OPT.SCHWAB.API WHERE name = :name",
+                {"name": "MAIN_DATA"}
+            )
+        """
+        if session is not None:
+            return session.execute(_as_text(query), params).scalars().all()
+
+        session = self.get_session(persistent)
+        try:
+            return session.execute(_as_text(query), params).scalars().all()
+        finally:
+            # Clean up transient sessions automatically
+            if not persistent:
+                session.close()
+
+    def execute_non_query(self, query, params=None, persistent=False, session=None):
         """
         Execute an INSERT, UPDATE, or DELETE query.
 
@@ -173,9 +588,12 @@ class DB:
         the transaction. Automatically handles session management.
 
         Args:
-            query (str): SQL query string (can contain named parameters like :param_name)
-            params (dict, optional): Dictionary of parameter values for the query
+            query (str | TextClause): SQL query string (can contain named parameters like :param_name)
+            params (dict | list, optional): Dictionary of parameter values for the query,
+                                          or a list of dictionaries to run as one executemany batch
             persistent (bool): Whether to use a persistent session (default: False)
+            session (Session, optional): Caller-owned session (e.g. from session_scope());
+                                       when given, it is used as-is and not closed
 
         Example:
             db.execute_non_query(
@@ -187,12 +605,17 @@ class DB:
             Uses parameterized queries to prevent SQL injection attacks.
 
         Note:
-            Automatically commits the transaction after execution.
+            Automatically commits the transaction after execution, unless a
+            caller-owned session is given, in which case the caller commits.
         """
+        if session is not None:
+            session.execute(_as_text(query), params)
+            return
+
         session = self.get_session(persistent)
         try:
             # Execute parameterized query for security
-            session.execute(text(query), params)
+            session.execute(_as_text(query), params)
             session.commit()  # Commit the transaction
         finally:
             # Clean up transient sessions automatically
@@ -335,20 +758,37 @@ class DB:
             self._persistent_connection.close()
             self._persistent_connection = None
 
-    def _load_market_hours_config(self):
+    def _load_market_hours_config(self, config):
         """
         Load market hours configuration from centralized config system.
 
         Loads schema and table names for market hours data from the
         centralized configuration system.
+
+        Args:
+            config (Config): Centralized configuration instance
         """
-        config = get_config()
         market_hours_config = config.get('database.market_hours', {})
         self.market_hours_config = {
             'schema': market_hours_config.get('schema', 'OPT.SCHWAB'),
             'table': market_hours_config.get('table', 'MARKET_HOURS')
         }
 
+        # Build the get_next_session statement once so SQLAlchemy's compiled
+        # cache hits on every call; typed binds skip per-call type inference
+        schema = self.market_hours_config['schema']
+        table = self.market_hours_config['table']
+        self._next_session_query = text(f"""
+            SELECT TOP 1 market_date, session_start, session_end
+            FROM {schema}.{table}
+            WHERE is_open = 1
+              AND ((market_date > :today_str) OR (market_date = :today_str AND session_end > :now_time))
+            ORDER BY market_date ASC, session_start ASC
+        """).bindparams(
+            bindparam("today_str", type_=String),
+            bindparam("now_time", type_=String),
+        )
+
     def get_token(self, api_name: str) -> str:
         """
         Fetch the access token string from the OPT.SCHWAB.API table for the given api_name.
@@ -384,10 +824,50 @@ class DB:
         params = {"api_name": api_name}
 
         try:
-            result = self.execute_query(query, params)
+            result = self.execute_scalars(query, params)
             if not result:
                 raise ValueError(f"No token found for API name '{api_name}'")
-            return result[0].access_token
+            return result[0]
+        except Exception as e:
+            # Re-raise with more context if it's not already a ValueError
+            if not isinstance(e, ValueError):
+                raise Exception(f"Database error while fetching token for '{api_name}': {str(e)}") from e
+            raise
+
+    def get_token_with_expiry(self, api_name: str) -> tuple[str, float]:
+        """
+        Fetch the access token and its expiry for the given api_name.
+
+        Same lookup as get_token(), but also returns access_token_expires_at so
+        callers can cache the token until it is due for refresh.
+
+        Args:
+            api_name (str): The 'name' column in OPT.SCHWAB.API identifying which token to fetch.
+
+        Returns:
+            tuple[str, float]: (access_token, expiry as Unix timestamp; 0 if unknown)
+
+        Raises:
+            ValueError: If no row is found matching the provided api_name.
+            Exception: If there is an issue connecting to or querying the database.
+
+        Example:
+            db = DB()
+            token, expires_at = db.get_token_with_expiry('DATA_API')
+
+        Note:
+            Expiry values are stored as naive UTC datetimes (see
+            SchwabAPI.save_tokens_to_db) and are interpreted as UTC here.
+        """
+        query = "SELECT access_token, access_token_expires_at FROM OPT.SCHWAB.API WHERE name = :api_name"
+        params = {"api_name": api_name}
+
+        try:
+            rows = self.execute_query_rows(query, params)
+            if not rows:
+                raise ValueError(f"No token found for API name '{api_name}'")
+            token, expires_at = rows[0]
+            return token, expires_at.replace(tzinfo=timezone.utc).timestamp() if expires_at else 0
         except Exception as e:
             # Re-raise with more context if it's not already a ValueError
             if not isinstance(e, ValueError):
@@ -439,49 +919,52 @@ class DB:
         today_str = time.strftime("%Y-%m-%d")
         now_time = time.strftime("%H:%M:%S")
 
-        # Build the SQL query using configured schema and table names
-        schema = self.market_hours_config['schema']
-        table = self.market_hours_config['table']
-
-        query = f"""
-            SELECT TOP 1 market_date, session_start, session_end
-            FROM {schema}.{table}
-            WHERE is_open = 1
-              AND ((market_date > :today_str) OR (market_date = :today_str AND session_end > :now_time))
-            ORDER BY market_date ASC, session_start ASC
-        """
-
         params = {
             "today_str": today_str,
             "now_time": now_time
         }
 
         try:
-            result = self.execute_query(query, params)
+            # Pre-built statement using configured schema and table names
+            result = self.execute_query(self._next_session_query, params)
             if not result:
                 return None, None
 
             # Unpack the returned row: market_date is a datetime.date object
             row = result[0]
-            next_date, sess_start, sess_end = row.market_date, row.session_start, row.session_end
-
-            # Format them back into full datetime strings
-            date_str = next_date.strftime("%Y-%m-%d")
-            dt_start = f"{date_str} {sess_start}"
-            dt_end = f"{date_str} {sess_end}"
-
-            try:
-                # Convert "YYYY-MM-DD HH:MM:SS" into Unix timestamps (seconds since epoch)
-                start_epoch = time.mktime(time.strptime(dt_start, "%Y-%m-%d %H:%M:%S"))
-                end_epoch = time.mktime(time.strptime(dt_end, "%Y-%m-%d %H:%M:%S"))
-                return start_epoch, end_epoch
-            except ValueError:
-                # If parsing fails (malformed data), return no session
-                return None, None
+            return self._session_epochs(row.market_date, row.session_start, row.session_end)
 
         except Exception as e:
             raise Exception(f"Database error while fetching next market session: {str(e)}") from e
 
+    @staticmethod
+    def _session_epochs(next_date, sess_start, sess_end) -> tuple[float, float] | tuple[None, None]:
+        """
+        Convert a MARKET_HOURS row's date and session times into Unix timestamps.
+
+        Args:
+            next_date (date): Market date
+            sess_start: Session start time (time object or 'HH:MM:SS' string)
+            sess_end: Session end time (time object or 'HH:MM:SS' string)
+
+        Returns:
+            tuple[float, float] | tuple[None, None]: (start_epoch, end_epoch),
+            or (None, None) if the stored times cannot be parsed
+        """
+        # Format them back into full datetime strings
+        date_str = next_date.strftime("%Y-%m-%d")
+        dt_start = f"{date_str} {sess_start}"
+        dt_end = f"{date_str} {sess_end}"
+
+        try:
+            # Convert "YYYY-MM-DD HH:MM:SS" into Unix timestamps (seconds since epoch)
+            start_epoch = time.mktime(time.strptime(dt_start, "%Y-%m-%d %H:%M:%S"))
+            end_epoch = time.mktime(time.strptime(dt_end, "%Y-%m-%d %H:%M:%S"))
+            return start_epoch, end_epoch
+        except ValueError:
+            # If parsing fails (malformed data), return no session
+            return None, None
+
     def load_market_schedule(self, days_ahead: int = 30) -> dict:
         """
         Load market hours from database for current and future dates.
@@ -514,8 +997,6 @@ class DB:
             This method uses a transient session that is automatically closed
             after the query execution. Returns empty dict if no data found.
         """
-        from datetime import date
-
         # Build the SQL query using configured schema and table names
         schema = self.market_hours_config['schema']
         table = self.market_hours_config['table']
@@ -530,7 +1011,7 @@ class DB:
         params = {"today": date.today()}
 
         try:
-            result = self.execute_query(query, params)
+            result = self.execute_query_rows(query, params)
 
             market_schedule = {}
             for row in result:
@@ -704,6 +1185,99 @@ class DB:
             table_full_name = f"{schema_name}.{table_name}" if schema_name else table_name
             raise Exception(f"Database error while writing DataFrame to table '{table_full_name}': {str(e)}") from e
 
+    def insert_candles(self, freq: str, rows: list):
+        """
+        Bulk insert OHLC candles into the PYTHON.MINUTE or PYTHON.DAY staging table.
+
+        Args:
+            freq (str): 'MINUTE' or 'DAY' - selects the target table
+            rows (list): Row dicts with open, high, low, close, volume, datetime,
+                         Symbol and freq keys (plus date for 'DAY')
+
+        Raises:
+            KeyError: If freq is not 'MINUTE' or 'DAY'
+            Exception: If there is an issue writing to the database
+
+        Example:
+            db.insert_candles('DAY', [{
+                "open": 5900.0, "high": 5950.0, "low": 5880.0, "close": 5921.5,
+                "volume": 0, "datetime": datetime(2024, 12, 18, 6, 0),
+                "date": date(2024, 12, 18), "Symbol": "SPX", "freq": "DAY",
+            }])
+
+        Note:
+            All rows go to the driver as one executemany batch (fast_executemany),
+            instead of to_sql's multi-row INSERTs built by pandas.
+        """
+        statement = _INSERT_CANDLES_SQL[freq]
+        if not rows:
+            return
+        try:
+            self.execute_non_query(statement, rows)
+        except Exception as e:
+            # Re-raise with more context for debugging
+            raise Exception(f"Database error while inserting {freq} candles: {str(e)}") from e
+
+    def read_sql(self, query: str, params=None, use_arrow: bool = False) -> pd.DataFrame:
+        """
+        Execute a SELECT query and return the results as a DataFrame.
+
+        Counterpart to df_to_sql(). By default the query runs through the
+        SQLAlchemy engine via pandas.read_sql_query. With use_arrow=True the
+        result set is fetched column-wise through turbodbc's Apache Arrow
+        adapter, which avoids building Python objects per row and is much
+        faster for large result sets.
+
+        Args:
+            query (str): SQL query string. Uses named parameters (:param_name)
+                         by default, or ? placeholders when use_arrow is True.
+            params (dict | list, optional): Query parameters - a dict for the
+                         default path, a sequence for the Arrow path.
+            use_arrow (bool): Fetch via turbodbc/Arrow (default: False)
+
+        Returns:
+            pandas.DataFrame: Query results
+
+        Raises:
+            ImportError: If use_arrow is True and turbodbc is not installed.
+            Exception: If there is an issue connecting to or querying the database.
+
+        Example:
+            db = DB()
+            df = db.read_sql(
+                "SELECT * FROM PYTHON.MINUTE WHERE Symbol = :symbol",
+                {"symbol": "SPX"}
+            )
+
+            # Arrow path for large reads
+            df = db.read_sql("SELECT * FROM PYTHON.MINUTE WHERE Symbol = ?", ["SPX"], use_arrow=True)
+        """
+        if use_arrow and turbodbc is None:
+            raise ImportError("read_sql(use_arrow=True) requires the 'turbodbc' package")
+
+        try:
+            if use_arrow:
+                connection = turbodbc.connect(
+                    driver=self.config['driver'],
+                    server=f"{self.config['host']},{self.config['port']}",
+                    database=self.config['database'],
+                    uid=self.config['username'],
+                    pwd=self.config['password'],
+                    TrustServerCertificate="yes",
+                )
+                try:
+                    cursor = connection.cursor()
+                    cursor.execute(query, params or [])
+                    return cursor.fetchallarrow().to_pandas()
+                finally:
+                    connection.close()
+
+            with self.engine.connect() as conn:
+                return pd.read_sql_query(text(query), conn, params=params)
+        except Exception as e:
+            # Re-raise with more context for debugging
+            raise Exception(f"Database error while reading query into DataFrame: {str(e)}") from e
+
     def insert_raw_json(self, order: dict):
         """
         Insert raw JSON order data into OPT.SCHWAB.JSON_TRANSACTIONS table.
@@ -731,12 +1305,9 @@ class DB:
             Uses parameterized queries to prevent SQL injection attacks.
 
         Note:
-            This method uses IF NOT EXISTS to prevent duplicate entries based on
-            OrderID, Status, and enteredTime combination.
+            Duplicate entries (same OrderID, Status and enteredTime) are dropped
+            by the table's IGNORE_DUP_KEY unique index rather than a lookup.
         """
-        import json
-        from tools.utils import parse_date, convert_to_pacific_time
-
         # Extract key fields and convert JSON to string
         json_data = json.dumps(order)
         order_id = order["orderId"]
@@ -744,18 +1315,6 @@ class DB:
         entered_time = parse_date(order["enteredTime"])
         entered_time_pacific = convert_to_pacific_time(entered_time)
 
-        # SQL query with duplicate prevention
-        query = """
-            IF NOT EXISTS (
-                SELECT 1 FROM OPT.SCHWAB.JSON_TRANSACTIONS
-                WHERE OrderID = :orderId AND Status = :status AND enteredTime = :enteredTime
-            )
-            BEGIN
-                INSERT INTO OPT.SCHWAB.JSON_TRANSACTIONS (OrderID, Status, enteredTime, JsonData)
-                VALUES (:orderId, :status, :enteredTime, :jsonData)
-            END
-        """
-
         params = {
             "orderId": order_id,
             "status": status,
@@ -765,274 +1324,170 @@ class DB:
 
         try:
             # Execute the insert using parameterized query for security
-            self.execute_non_query(query, params)
+            self.execute_non_query(_INSERT_RAW_JSON_SQL, params)
         except Exception as e:
             # Re-raise with more context for debugging
             raise Exception(f"Database error while inserting raw JSON for order '{order_id}': {str(e)}") from e
 
-    def insert_order(self, order: dict, parent_order_id: str = None):
+    def _order_row(self, order: dict, parent_order_id: str = None) -> dict:
         """
-        Insert order details into PYTHON.Orders table.
+        Build the PYTHON.Orders parameter row for an order.
 
-        Stores structured order information with duplicate prevention based on orderId.
         Handles timezone conversion for time fields.
 
         Args:
             order (dict): Order dictionary from Schwab API
             parent_order_id (str, optional): Parent order ID for child orders
 
-        Raises:
-            Exception: If there is an issue connecting to or inserting into the database.
-
-        Security:
-            Uses parameterized queries to prevent SQL injection attacks.
-
-        Note:
-            This method uses IF NOT EXISTS to prevent duplicate entries based on orderId.
-        """
-        from tools.utils import parse_date, convert_to_pacific_time
-
-        # Parse and convert time fields
-        entered_time = parse_date(order['enteredTime'])
-        close_time = parse_date(order['closeTime']) if 'closeTime' in order else None
-
-        entered_time_pacific = convert_to_pacific_time(entered_time) if entered_time else None
-        close_time_pacific = convert_to_pacific_time(close_time) if close_time else None
-
-        # SQL query with duplicate prevention
-        query = """
-            IF NOT EXISTS (
-                SELECT 1 FROM PYTHON.Orders
-                WHERE orderId = :orderId
-            )
-            BEGIN
-                INSERT INTO PYTHON.Orders (orderId, session, duration, orderType, complexOrderStrategyType, quantity, filledQuantity,
-                                    remainingQuantity, requestedDestination, destinationLinkName, stopPrice, stopType,
-                                    orderStrategyType, cancelable, editable, status, enteredTime, closeTime, tag, accountNumber, parentOrderId)
-                VALUES (:orderId, :session, :duration, :orderType, :complexOrderStrategyType, :quantity, :filledQuantity,
-                        :remainingQuantity, :requestedDestination, :destinationLinkName, :stopPrice, :stopType,
-                        :orderStrategyType, :cancelable, :editable, :status, :enteredTime, :closeTime, :tag, :accountNumber, :parentOrderId)
-            END
+        Returns:
+            dict: Parameters for _INSERT_ORDER_SQL
         """
+        row = dict(zip(_ORDER_PASSTHROUGH_FIELDS, map(order.get, _ORDER_PASSTHROUGH_FIELDS)))
+        row["orderId"] = _to_str(order['orderId'])
+        row["parentOrderId"] = parent_order_id
 
-        params = {
-            "orderId": order['orderId'],
-            "session": order.get('session'),
-            "duration": order.get('duration'),
-            "orderType": order.get('orderType'),
-            "complexOrderStrategyType": order.get('complexOrderStrategyType'),
-            "quantity": order.get('quantity'),
-            "filledQuantity": order.get('filledQuantity'),
-            "remainingQuantity": order.get('remainingQuantity'),
-            "requestedDestination": order.get('requestedDestination'),
-            "destinationLinkName": order.get('destinationLinkName'),
-            "stopPrice": order.get('stopPrice'),
-            "stopType": order.get('stopType'),
-            "orderStrategyType": order.get('orderStrategyType'),
-            "cancelable": order.get('cancelable'),
-            "editable": order.get('editable'),
-            "status": order.get('status'),
-            "enteredTime": entered_time_pacific,
-            "closeTime": close_time_pacific,
-            "tag": order.get('tag'),
-            "accountNumber": order.get('accountNumber'),
-            "parentOrderId": parent_order_id,
-        }
-
-        try:
-            # Execute the insert using parameterized query for security
-            self.execute_non_query(query, params)
-        except Exception as e:
-            # Re-raise with more context for debugging
-            raise Exception(f"Database error while inserting order '{order['orderId']}': {str(e)}") from e
+        # Convert time fields (memoized by input string)
+        close_time = order.get('closeTime')
+        row["enteredTime"] = convert_to_pacific_time(order['enteredTime'])
+        row["closeTime"] = convert_to_pacific_time(close_time) if close_time else None
+        return row
 
-    def insert_order_leg(self, order_id: str, leg: dict):
+    def _order_leg_row(self, order_id: str, leg: dict) -> dict:
         """
-        Insert order legs into PYTHON.OrderLegs table.
-
-        Stores individual order leg information with instrument details.
-        Handles duplicate prevention based on legId and orderId combination.
+        Build the PYTHON.OrderLegs parameter row for an order leg.
 
         Args:
             order_id (str): The order ID this leg belongs to
             leg (dict): Order leg dictionary from Schwab API
 
-        Raises:
-            Exception: If there is an issue connecting to or inserting into the database.
-
-        Security:
-            Uses parameterized queries to prevent SQL injection attacks.
-
-        Note:
-            This method uses IF NOT EXISTS to prevent duplicate entries.
+        Returns:
+            dict: Parameters for _INSERT_ORDER_LEG_SQL
         """
         instrument = leg['instrument']
 
-        # SQL query with duplicate prevention
-        query = """
-            IF NOT EXISTS (
-                SELECT 1 FROM PYTHON.OrderLegs
-                WHERE legId = :legId AND orderId = :orderId
-            )
-            BEGIN
-                INSERT INTO PYTHON.OrderLegs (legId, orderId, orderLegType, assetType, cusip, symbol, description, instrumentId, type,
-                                    putCall, underlyingSymbol, instruction, positionEffect, quantity)
-                VALUES (:legId, :orderId, :orderLegType, :assetType, :cusip, :symbol, :description, :instrumentId, :type,
-                        :putCall, :underlyingSymbol, :instruction, :positionEffect, :quantity)
-            END
-        """
-
-        params = {
-            "legId": leg['legId'],
-            "orderId": order_id,
-            "orderLegType": leg.get('orderLegType'),
-            "assetType": instrument.get('assetType'),
-            "cusip": instrument.get('cusip'),
-            "symbol": instrument.get('symbol'),
-            "description": instrument.get('description'),
-            "instrumentId": instrument.get('instrumentId'),
-            "type": instrument.get('type'),
-            "putCall": instrument.get('putCall'),
-            "underlyingSymbol": instrument.get('underlyingSymbol'),
-            "instruction": leg.get('instruction'),
-            "positionEffect": leg.get('positionEffect'),
-            "quantity": leg.get('quantity'),
-        }
+        row = dict(zip(_ORDER_LEG_PASSTHROUGH_FIELDS, map(leg.get, _ORDER_LEG_PASSTHROUGH_FIELDS)))
+        row.update(zip(_INSTRUMENT_PASSTHROUGH_FIELDS, map(instrument.get, _INSTRUMENT_PASSTHROUGH_FIELDS)))
+        row["legId"] = _to_str(leg['legId'])
+        row["orderId"] = order_id
+        row["instrumentId"] = _to_str(instrument.get('instrumentId'))
+        return row
 
-        try:
-            # Execute the insert using parameterized query for security
-            self.execute_non_query(query, params)
-        except Exception as e:
-            # Re-raise with more context for debugging
-            raise Exception(f"Database error while inserting order leg for order '{order_id}': {str(e)}") from e
-
-    def insert_order_activity(self, order_id: str, activity: dict) -> int:
+    def _order_activity_row(self, order_id: str, activity: dict) -> dict:
         """
-        Insert order activity into PYTHON.OrderActivities table.
-
-        Stores order activity information and returns the activity ID for
-        linking execution legs.
+        Build the PYTHON.OrderActivities parameter row for an order activity.
 
         Args:
             order_id (str): The order ID this activity belongs to
             activity (dict): Order activity dictionary from Schwab API
 
         Returns:
-            int: The activity ID of the inserted record, or None if insertion failed
+            dict: Parameters for _merge_activities_sql()
+        """
+        row = dict(zip(_ACTIVITY_COLUMNS, map(activity.get, _ACTIVITY_COLUMNS)))
+        row["orderId"] = order_id
+        return row
 
-        Raises:
-            Exception: If there is an issue connecting to or inserting into the database.
+    def _execution_leg_row(self, activity_id: int, leg: dict) -> dict:
+        """
+        Build the PYTHON.ExecutionLegs parameter row for an execution leg.
 
-        Security:
-            Uses parameterized queries to prevent SQL injection attacks.
+        Args:
+            activity_id (int): The activity ID this execution leg belongs to
+            leg (dict): Execution leg dictionary from Schwab API
 
-        Note:
-            This method uses IF NOT EXISTS to prevent duplicate entries and
-            retrieves the activity ID for linking execution legs.
+        Returns:
+            dict: Parameters for _INSERT_EXECUTION_LEG_SQL
         """
-        # SQL query with duplicate prevention
-        query = """
-            IF NOT EXISTS (
-                SELECT 1 FROM PYTHON.OrderActivities
-                WHERE orderId = :orderId AND activityType = :activityType AND executionType = :executionType AND quantity = :quantity AND orderRemainingQuantity = :orderRemainingQuantity
-            )
-            BEGIN
-                INSERT INTO PYTHON.OrderActivities (orderId, activityType, executionType, quantity, orderRemainingQuantity)
-                VALUES (:orderId, :activityType, :executionType, :quantity, :orderRemainingQuantity)
-            END
+        return {
+            "activityId": activity_id,
+            "legId": _to_str(leg['legId']),
+            "quantity": leg['quantity'],
+            "mismarkedQuantity": leg['mismarkedQuantity'],
+            "price": leg['price'],
+            "time": parse_date(leg['time']),
+            "instrumentId": _to_str(leg['instrumentId']),
+        }
+
+    def _merge_order_activities(self, activity_rows: list, session) -> list:
         """
+        Insert order activities and return the activityId for each row.
 
-        params = {
-            "orderId": order_id,
-            "activityType": activity.get('activityType'),
-            "executionType": activity.get('executionType'),
-            "quantity": activity.get('quantity'),
-            "orderRemainingQuantity": activity.get('orderRemainingQuantity'),
-        }
+        Identical activities are sent once. Each batch is a single round-trip
+        that inserts the new activities and returns the activityId of every
+        row, new or existing.
 
-        try:
-            # Execute the insert using parameterized query for security
-            self.execute_non_query(query, params)
+        Args:
+            activity_rows (list): Rows built by _order_activity_row()
+            session (Session): Session for the enclosing transaction
 
-            # Retrieve the inserted activity_id
-            activity_id_query = """
-                SELECT TOP 1 activityId FROM PYTHON.OrderActivities
-                WHERE orderId = :orderId AND activityType = :activityType
-                ORDER BY activityId DESC
-            """
+        Returns:
+            list: activityId per input row, in input order
+        """
+        # Deduplicate on the full activity key, remembering each row's slot
+        keys = [tuple(row[column] for column in _ACTIVITY_COLUMNS) for row in activity_rows]
+        unique_keys = list(dict.fromkeys(keys))
 
-            result = self.execute_query(activity_id_query, {
-                "orderId": order_id,
-                "activityType": activity.get('activityType'),
-            })
+        ids_by_key = {}
+        for start in range(0, len(unique_keys), _ACTIVITY_BATCH):
+            batch = unique_keys[start:start + _ACTIVITY_BATCH]
+            params = {}
+            for i, key in enumerate(batch):
+                params[f"idx_{i}"] = i
+                for column, value in zip(_ACTIVITY_COLUMNS, key):
+                    params[f"{column}_{i}"] = value
 
-            return result[0].activityId if result else None
+            for idx, activity_id in self.execute_query_rows(_merge_activities_sql(len(batch)), params, session=session):
+                ids_by_key[batch[idx]] = activity_id
 
-        except Exception as e:
-            # Re-raise with more context for debugging
-            raise Exception(f"Database error while inserting order activity for order '{order_id}': {str(e)}") from e
+        return [ids_by_key.get(key) for key in keys]
 
-    def insert_execution_leg(self, activity_id: int, leg: dict):
+    def _collect_order_rows(self, order: dict, parent_order_id: str = None):
         """
-        Insert execution legs into PYTHON.ExecutionLegs table.
+        Walk an order tree and collect its rows for batched insertion.
 
-        Stores execution leg information linked to an order activity.
-        Handles duplicate prevention and time conversion.
+        Uses an explicit stack rather than recursion, so deeply nested
+        childOrderStrategies cost no extra Python frames. Orders are visited
+        parent-first in the same order as a recursive walk.
 
         Args:
-            activity_id (int): The activity ID this execution leg belongs to
-            leg (dict): Execution leg dictionary from Schwab API
+            order (dict): Root order dictionary from Schwab API
+            parent_order_id (str, optional): Parent order ID for the root order
 
-        Raises:
-            Exception: If there is an issue connecting to or inserting into the database.
-
-        Security:
-            Uses parameterized queries to prevent SQL injection attacks.
-
-        Note:
-            This method uses IF NOT EXISTS to prevent duplicate entries and
-            converts execution time to proper format.
+        Returns:
+            tuple: (orders_rows, legs_rows, activities) where activities is a
+            list of (activity row, execution legs) pairs
         """
-        from tools.utils import parse_date
+        orders_rows, legs_rows, activities = [], [], []
+        stack = [(order, parent_order_id)]
 
-        # Parse execution time
-        execution_time = parse_date(leg['time'])
+        while stack:
+            order, parent_order_id = stack.pop()
+            orders_rows.append(self._order_row(order, parent_order_id))
+            order_id = _to_str(order['orderId'])
 
-        # SQL query with duplicate prevention
-        query = """
-            IF NOT EXISTS (
-                SELECT 1 FROM PYTHON.ExecutionLegs
-                WHERE activityId = :activityId AND legId = :legId
-            )
-            BEGIN
-                INSERT INTO PYTHON.ExecutionLegs (activityId, legId, quantity, mismarkedQuantity, price, time, instrumentId)
-                VALUES (:activityId, :legId, :quantity, :mismarkedQuantity, :price, :time, :instrumentId)
-            END
-        """
+            # Collect order legs
+            for leg in order.get('orderLegCollection', ()):
+                legs_rows.append(self._order_leg_row(order_id, leg))
 
-        params = {
-            "activityId": activity_id,
-            "legId": leg['legId'],
-            "quantity": leg['quantity'],
-            "mismarkedQuantity": leg['mismarkedQuantity'],
-            "price": leg['price'],
-            "time": execution_time,
-            "instrumentId": leg['instrumentId'],
-        }
+            # Collect order activities, keeping their execution legs alongside
+            for activity in order.get('orderActivityCollection', ()):
+                activities.append((self._order_activity_row(order_id, activity),
+                                   activity.get('executionLegs', [])))
 
-        try:
-            # Execute the insert using parameterized query for security
-            self.execute_non_query(query, params)
-        except Exception as e:
-            # Re-raise with more context for debugging
-            raise Exception(f"Database error while inserting execution leg for activity '{activity_id}': {str(e)}") from e
+            # Queue child orders; reversed so they pop in their original order
+            stack.extend((child_order, order_id)
+                         for child_order in reversed(order.get('childOrderStrategies', ())))
+
+        return orders_rows, legs_rows, activities
 
     def process_order(self, order: dict, parent_order_id: str = None):
         """
         Process the full order structure, including legs, activities, and execution legs.
 
         This is the main method for processing complete order data from Schwab API.
-        It handles the entire order hierarchy including child orders recursively.
+        It walks the entire order hierarchy (including child orders) once, then
+        writes each table with a single batched statement, so a complex order
+        costs a handful of round-trips instead of one per row.
 
         Args:
             order (dict): Complete order dictionary from Schwab API
@@ -1053,37 +1508,58 @@ class DB:
             db.process_order(order_data)
 
         Note:
-            This method processes orders recursively to handle child order strategies.
-            It maintains referential integrity between orders, legs, activities, and executions.
+            All inserts for the order tree run in a single transaction, so the
+            hierarchy is written all-or-nothing. Rows that already exist are
+            dropped by IGNORE_DUP_KEY unique keys, so re-processing an order
+            is safe. Activity IDs come back from the activity batch's keyed
+            SELECT so execution legs keep their link to the parent activity.
+            A transaction chosen as a deadlock victim (error 1205) is retried
+            up to _DEADLOCK_RETRIES times.
         """
         try:
-            # Insert the main order
-            self.insert_order(order, parent_order_id)
-            order_id = order['orderId']
-
-            # Process order legs
-            if 'orderLegCollection' in order:
-                for leg in order['orderLegCollection']:
-                    self.insert_order_leg(order_id, leg)
-
-            # Process order activities and their execution legs
-            if 'orderActivityCollection' in order:
-                for activity in order['orderActivityCollection']:
-                    activity_id = self.insert_order_activity(order_id, activity)
-                    if activity_id and 'executionLegs' in activity:
-                        for leg in activity['executionLegs']:
-                            self.insert_execution_leg(activity_id, leg)
-
-            # Process child orders recursively
-            if 'childOrderStrategies' in order:
-                for child_order in order['childOrderStrategies']:
-                    self.process_order(child_order, order_id)
+            orders_rows, legs_rows, activities = self._collect_order_rows(order, parent_order_id)
+
+            # The transaction is all-or-nothing, so a deadlock victim can simply re-run it
+            for attempt in range(_DEADLOCK_RETRIES + 1):
+                try:
+                    self._write_order_rows(orders_rows, legs_rows, activities)
+                    return
+                except Exception as e:
+                    if attempt == _DEADLOCK_RETRIES or not _is_deadlock(e):
+                        raise
+                    time.sleep(0.05 * 2 ** attempt + random.uniform(0, 0.05))
 
         except Exception as e:
             # Re-raise with more context for debugging
             raise Exception(f"Database error while processing order '{order.get('orderId', 'UNKNOWN')}': {str(e)}") from e
 
+    def _write_order_rows(self, orders_rows: list, legs_rows: list, activities: list):
+        """
+        Write an order tree's collected rows in one transaction.
 
-
-
+        Args:
+            orders_rows (list): Rows for _INSERT_ORDER_SQL
+            legs_rows (list): Rows for _INSERT_ORDER_LEG_SQL
+            activities (list): (activity row, execution legs) pairs from _collect_order_rows()
+        """
+        # Write the whole hierarchy on one connection in one transaction
+        with self.transaction_scope() as session:
+            # Insert orders and legs, one batch per table
+            self.execute_non_query(_INSERT_ORDER_SQL, orders_rows, session=session)
+            if legs_rows:
+                self.execute_non_query(_INSERT_ORDER_LEG_SQL, legs_rows, session=session)
+
+            if not activities:
+                return
+
+            # Insert activities and get their IDs back in the same round-trip
+            activity_ids = self._merge_order_activities([row for row, _ in activities], session)
+
+            # Insert execution legs linked to their activity
+            exec_rows = []
+            for (row, execution_legs), activity_id in zip(activities, activity_ids):
+                if activity_id:
+                    exec_rows.extend(self._execution_leg_row(activity_id, leg) for leg in execution_legs)
+            if exec_rows:
+                self.execute_non_query(_INSERT_EXECUTION_LEG_SQL, exec_rows, session=session)
 
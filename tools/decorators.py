@@ -1,36 +1,53 @@
 import httpx
+import random
 import asyncio
+import logging
 import functools
-import traceback
 
-def retry_httpx(max_retries=3, initial_delay=1):
-    """Decorator to retry HTTP requests on timeout or errors."""
+logger = logging.getLogger(__name__)
+
+# Retry decision per exception type: returns True when the failure is transient.
+# Anything not listed here (or for which the predicate is False) is not retried.
+_RETRYABLE = {
+    httpx.ReadTimeout: lambda e: True,
+    httpx.HTTPStatusError: lambda e: 500 <= e.response.status_code < 600,
+}
+
+
+def _is_retryable(exc):
+    predicate = _RETRYABLE.get(type(exc))
+    return predicate is not None and predicate(exc)
+
+
+def _backoff_delay(attempt, initial_delay, max_delay):
+    """Exponential backoff with additive jitter so concurrent callers don't retry in lockstep."""
+    return min(max_delay, initial_delay * (2 ** attempt)) + random.uniform(0, initial_delay)
+
+
+def retry_httpx(max_retries=3, initial_delay=1, max_delay=30):
+    """Decorator to retry HTTP requests on timeout or server errors with jittered backoff."""
     def decorator(func):
+        name = func.__name__
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            retry_delay = initial_delay
             for attempt in range(max_retries):
                 try:
                     return await func(*args, **kwargs)  # Call the original function
-                except httpx.ReadTimeout:
-                    if attempt < max_retries - 1:
-                        print(f"Timeout in {func.__name__}. Retrying {attempt + 1}/{max_retries} after {retry_delay}s...")
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        print(f"Final retry failed for {func.__name__}. Skipping request.")
+                except (httpx.ReadTimeout, httpx.HTTPStatusError) as e:
+                    if not _is_retryable(e):
+                        logger.error("HTTP error %s in %s: %s. Skipping request.",
+                                     e.response.status_code, name, e.response.text)
                         return None
-                except httpx.HTTPStatusError as e:
-                    status_code = e.response.status_code
-                    if 500 <= status_code < 600 and attempt < max_retries - 1:
-                        print(f"Server error {status_code} in {func.__name__}. Retrying {attempt + 1}/{max_retries} after {retry_delay}s...")
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2
-                    else:
-                        print(f"HTTP error {status_code} in {func.__name__}: {e.response.text}. Skipping request.")
+                    if attempt == max_retries - 1:
+                        logger.error("Final retry failed for %s (%r). Skipping request.", name, e)
                         return None
-                except Exception as e:
-                    print(f"Unexpected error in {func.__name__}: {e}\n{traceback.format_exc()}. Skipping request.")
+                    delay = _backoff_delay(attempt, initial_delay, max_delay)
+                    logger.warning("%r in %s. Retrying %d/%d after %.1fs...",
+                                   e, name, attempt + 1, max_retries, delay)
+                    await asyncio.sleep(delay)
+                except Exception:
+                    logger.exception("Unexpected error in %s. Skipping request.", name)
                     return None
         return wrapper
     return decorator
@@ -9,6 +9,7 @@ Features:
 - Gmail SMTP integration (hardcoded for reliability)
 - Simple interface for sending notifications
 - Configurable recipient email address
+- Authenticated SMTP connection reused across notifications
 
 Dependencies:
 - smtplib: For SMTP email sending
@@ -22,42 +23,69 @@ Note:
 
 import smtplib
 import os
+import threading
 from email.message import EmailMessage
 from tools.config import get_config
 
+# Gmail SMTP configuration
+SMTP_SERVER = 'smtp.gmail.com'  # Gmail SMTP server - kept hardcoded
+SMTP_PORT = 465  # implicit TLS port - kept hardcoded
+SMTP_TIMEOUT = 30  # seconds; bounds a hung connect/send while the pool lock is held
 
-def send_email(subject, body):
-    """
-    Send an email notification using Gmail SMTP or log to screen. If email fails, logs to screen.
-
-    Sends an email with the specified subject and body to the configured
-    recipient if all email configuration is present. If any email configuration
-    is missing, logs the notification to the screen instead.
 
-    Args:
-        subject (str): The email subject line
-        body (str): The email body content (plain text)
-
-    Environment Variables Required:
-        EMAIL_USERNAME: Gmail username for SMTP authentication
-        EMAIL_PASSWORD: Gmail app password for SMTP authentication
-        NOTIFICATION_EMAIL: Target email address for notifications
+class _SMTPPool:
+    """
+    Single authenticated SMTP connection shared by every send_email call.
 
-    Behavior:
-        - If all email config is set: Sends email via Gmail SMTP
-        - If any email config is missing: Logs notification to screen
-        - If email sending fails: Logs notification to screen with error
+    The TLS handshake and AUTH are paid once; later notifications reuse the
+    open connection. A lock serialises senders, and a connection the server
+    has dropped (Gmail closes idle sessions) is reopened transparently.
+    """
 
-    Note:
-        Gmail SMTP configuration is hardcoded for reliability:
-        - Server: smtp.gmail.com
-        - Port: 587 (STARTTLS)
-        - Authentication: Username/password from environment variables
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._server = None
+        self._credentials = None
+
+    def _connect(self, username, password):
+        server = smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        server.login(username, password)
+        self._server = server
+        self._credentials = (username, password)
+
+    def _reset(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+        self._server = None
+
+    def send(self, msg, username, password):
+        with self._lock:
+            if self._server is None or self._credentials != (username, password):
+                self._reset()
+                self._connect(username, password)
+            try:
+                self._server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Stale connection: reconnect once and retry
+                self._reset()
+                self._connect(username, password)
+                self._server.send_message(msg)
+
+
+_smtp_pool = _SMTPPool()
+
+
+def _prepare_email(subject, body):
     """
-    # Gmail SMTP configuration
-    SMTP_SERVER = 'smtp.gmail.com'  # Gmail SMTP server - kept hardcoded
-    SMTP_PORT = 587  # STARTTLS port - kept hardcoded
+    Build the notification message, or log it to screen if email is not configured.
 
+    Returns:
+        tuple: (EmailMessage, username, password) when email is enabled and
+        fully configured, otherwise None (after printing the notification).
+    """
     # Get email configuration from centralized config system
     config = get_config()
     email_config = config.get_email_config()
@@ -83,7 +111,7 @@ def send_email(subject, body):
             missing_configs.append("EMAIL_PASSWORD")
 
         print(f"({', '.join(missing_configs)} - logged to screen only)")
-        return
+        return None
 
     # Construct email message
     msg = EmailMessage()
@@ -91,20 +119,54 @@ def send_email(subject, body):
     msg['From'] = email_username
     msg['To'] = recipient_email
     msg.set_content(body)
+    return msg, email_username, email_password
+
+
+def send_email(subject, body):
+    """
+    Send an email notification using Gmail SMTP or log to screen. If email fails, logs to screen.
+
+    Sends an email with the specified subject and body to the configured
+    recipient if all email configuration is present. If any email configuration
+    is missing, logs the notification to the screen instead.
 
-    # Send email using Gmail SMTP
+    Args:
+        subject (str): The email subject line
+        body (str): The email body content (plain text)
+
+    Environment Variables Required:
+        EMAIL_USERNAME: Gmail username for SMTP authentication
+        EMAIL_PASSWORD: Gmail app password for SMTP authentication
+        NOTIFICATION_EMAIL: Target email address for notifications
+
+    Behavior:
+        - If all email config is set: Sends email via Gmail SMTP
+        - If any email config is missing: Logs notification to screen
+        - If email sending fails: Logs notification to screen with error
+
+    Note:
+        Gmail SMTP configuration is hardcoded for reliability:
+        - Server: smtp.gmail.com
+        - Port: 465 (implicit TLS)
+        - Authentication: Username/password from environment variables
+        The authenticated connection is kept open and reused by later calls.
+    """
+    prepared = _prepare_email(subject, body)
+    if prepared is None:
+        return
+    msg, email_username, email_password = prepared
+
+    # Send email over the shared Gmail SMTP connection
     try:
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()  # Enable TLS encryption
-            server.login(email_username, email_password)  # Authenticate with Gmail
-            server.send_message(msg)  # Send the message
-            print(f"Email sent to {recipient_email}")
+        _smtp_pool.send(msg, email_username, email_password)
+        print(f"Email sent to {msg['To']}")
     except Exception as e:
         # If email fails, log to screen as fallback
         print(f"EMAIL NOTIFICATION (failed to send): {subject}")
         print(f"MESSAGE: {body}")
         print(f"Error: {e}")
 
+
 # Test function - uncomment to test email functionality
 # if __name__ == "__main__":
 #     send_email("Test Email", "This is a test email from your Schwab API project.")
@@ -1,8 +1,16 @@
 # tools/parquet_writer.py
 
 import os
+import glob
+import time
+import queue
 import atexit
-import pandas as pd
+import logging
+import threading
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+import pyarrow as pa
+import pyarrow.parquet as pq
 from dotenv import load_dotenv, find_dotenv
 
 load_dotenv(find_dotenv())
@@ -10,41 +18,246 @@ load_dotenv(find_dotenv())
 PARQUET_DIR = os.getenv("PARQUET_DIR", "./parquet")
 os.makedirs(PARQUET_DIR, exist_ok=True)
 
+# Queue sentinel telling the writer thread to flush, compact and exit
+_STOP = object()
+
+# Seconds to wait after a failed flush before size-triggered flushes retry
+_FLUSH_RETRY_SECONDS = 5
+
+
+def _next_midnight() -> float:
+    """Epoch seconds of the next local midnight, when the writer rolls to a new day."""
+    return datetime.combine(date.today() + timedelta(days=1), datetime.min.time()).timestamp()
+
+
+def day_parts_dir(date_str: str) -> str:
+    """Directory holding the not-yet-compacted part files for a day."""
+    return os.path.join(PARQUET_DIR, f"quotes_{date_str}")
+
+
+def day_file_path(date_str: str) -> str:
+    """Final single-file parquet for a day (what SP_IMPORT_PARQUET loads)."""
+    return os.path.join(PARQUET_DIR, f"quotes_{date_str}.parquet")
+
+
 class ParquetWriter:
-    def __init__(self, batch_size: int = 1000):
+    """
+    Append-only parquet sink for stream records.
+
+    Each flush writes the buffered batch as a new part file under
+    quotes_<date>/, so a flush costs O(batch) instead of re-reading and
+    rewriting the whole day. Part files are complete parquet files, so the
+    day stays readable (e.g. by the stream monitor) while it is written.
+    When the day rolls over or the writer closes, the parts are streamed
+    row group by row group into quotes_<date>.parquet.
+
+    write() only enqueues the record, so it is safe to call from any thread;
+    a single background thread owns the buffer and does all file I/O.
+    """
+
+    def __init__(self, batch_size: int = 1000, queue_size: int = 100_000,
+                 max_buffer: int = 100_000):
         self.batch_size = batch_size
-        self.buffer = []
+        # Records kept while flushes keep failing; beyond this the buffer is dropped
+        self.max_buffer = max_buffer
+        # Column-oriented buffer: column name -> list of values, all of length _count
+        self.buffer = defaultdict(list)
+        self._count = 0
         self._last_date = None
+        self._roll_at = _next_midnight()
+        self._part_index = 0
+        self._retry_at = 0.0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._drain, name="parquet-writer", daemon=True)
+        self._thread.start()
         atexit.register(self.close)
 
     def write(self, record: dict):
-        self.buffer.append(record)
-        # If date rolled over since last flush, force a flush
-        today = pd.Timestamp.now().strftime("%Y-%m-%d")
-        if self._last_date and self._last_date != today:
-            self.flush()
-        if len(self.buffer) >= self.batch_size:
+        """
+        Queue a record for the writer thread.
+
+        Raises:
+            RuntimeError: If the writer thread is not running (closed or died),
+                rather than queueing records nobody will drain
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("ParquetWriter is not running; record not written")
+        # Blocks only if the writer thread falls queue_size records behind
+        self._queue.put(record)
+
+    def _drain(self):
+        """Writer thread: move queued records into the buffer and flush batches."""
+        try:
+            compact_stale_days()
+        except Exception:
+            logging.exception("ParquetWriter: compacting earlier days failed")
+
+        while True:
+            try:
+                record = self._queue.get(timeout=1)
+            except queue.Empty:
+                record = None
+            if record is _STOP:
+                break
+
+            if record is not None:
+                try:
+                    self._append(record)
+                except Exception:
+                    # Drop the bad record but keep the thread (and the queue) alive
+                    logging.exception("ParquetWriter: dropping record that could not be buffered")
+                    self._drop_partial_record()
+
+            try:
+                # If date rolled over since last flush, force a flush; a float compare
+                # per record instead of formatting today's date every time
+                if time.time() >= self._roll_at:
+                    self._roll_at = _next_midnight()
+                    if self._last_date:
+                        self.flush()
+                if self._count >= self.batch_size and time.monotonic() >= self._retry_at:
+                    self.flush()
+            except Exception:
+                # Keep the thread alive; the buffer is retried after a pause
+                logging.exception("ParquetWriter: flush failed")
+                self._retry_at = time.monotonic() + _FLUSH_RETRY_SECONDS
+                if self._count >= self.max_buffer:
+                    logging.error("ParquetWriter: dropping %d buffered records after failed flushes", self._count)
+                    self._clear_buffer()
+
+        # Flush any remaining records and compact today's parts before exiting
+        try:
             self.flush()
+            compact_day(self._last_date)
+        except Exception:
+            logging.exception("ParquetWriter: final flush failed")
 
-    def flush(self):
-        date_str = pd.Timestamp.now().strftime("%Y-%m-%d")
-        path = os.path.join(PARQUET_DIR, f"quotes_{date_str}.parquet")
+    def _append(self, record: dict):
+        buffer = self.buffer
+        count = self._count
+        for key, value in record.items():
+            column = buffer[key]
+            if len(column) < count:
+                # First time this key appears in the batch: backfill earlier rows
+                column.extend([None] * (count - len(column)))
+            column.append(value)
+        self._count = count = count + 1
+        if len(record) < len(buffer):
+            # Record is missing some buffered columns: pad them with nulls
+            for column in buffer.values():
+                if len(column) < count:
+                    column.append(None)
 
-        # 1) On first flush of the day, create an empty file if none exists
-        if self._last_date != date_str and not os.path.exists(path):
-            pd.DataFrame().to_parquet(path, engine="pyarrow", compression="snappy")
+    def _drop_partial_record(self):
+        """Trim columns back to _count after a failed _append, keeping them aligned."""
+        for column in self.buffer.values():
+            del column[self._count:]
 
-        # 2) Append buffered records if any
-        if self.buffer:
-            df = pd.DataFrame(self.buffer)
-            if os.path.exists(path):
-                existing = pd.read_parquet(path)
-                df = pd.concat([existing, df], ignore_index=True)
-            df.to_parquet(path, engine="pyarrow", compression="snappy")
-            self.buffer.clear()
+    def _clear_buffer(self):
+        self.buffer.clear()
+        self._count = 0
+
+    def flush(self):
+        """Write the buffer as a part file. Runs on the writer thread."""
+        date_str = date.today().isoformat()
 
-        self._last_date = date_str
+        # 1) On date roll, write out the previous day before starting a new one
+        if self._last_date != date_str:
+            closed_date = self._last_date
+            if closed_date:
+                # Buffered records belong to the day being closed
+                self._write_part(closed_date)
+            # Move to the new day before compacting, so a failed compaction
+            # can't send later batches into the closed day's directory
+            self._last_date = date_str
+            self._part_index = self._next_part_index(date_str)
+            if closed_date:
+                try:
+                    compact_day(closed_date)
+                except Exception:
+                    # Parts stay on disk; compact_stale_days picks them up on the next start
+                    logging.exception("ParquetWriter: compacting %s failed", closed_date)
+
+        # 2) Append buffered records as a new part file
+        self._write_part(date_str)
 
     def close(self):
-        """Flush any remaining records before shutdown."""
-        self.flush()
+        """Drain the queue, flush and compact today's parts, and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _write_part(self, date_str: str):
+        if not self._count:
+            return
+        parts_dir = day_parts_dir(date_str)
+        os.makedirs(parts_dir, exist_ok=True)
+        try:
+            table = pa.Table.from_pydict(self.buffer)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # A column mixing types fails the same way on every retry: drop the batch
+            logging.exception("ParquetWriter: dropping %d records that could not be converted", self._count)
+            self._clear_buffer()
+            return
+        path = os.path.join(parts_dir, f"part-{self._part_index:05d}.parquet")
+        # Write under a dot-prefixed name (skipped by directory readers and the
+        # part-*.parquet glob) and rename, so readers never see a half-written part
+        tmp_path = os.path.join(parts_dir, f".part-{self._part_index:05d}.parquet.tmp")
+        pq.write_table(table, tmp_path, compression="snappy")
+        os.replace(tmp_path, path)
+        self._part_index += 1
+        self._clear_buffer()
+
+    @staticmethod
+    def _next_part_index(date_str: str) -> int:
+        # Continue numbering after parts left by an earlier run the same day
+        return len(glob.glob(os.path.join(day_parts_dir(date_str), "part-*.parquet")))
+
+
+def compact_day(date_str: str):
+    """
+    Merge a day's part files (and any existing day file) into quotes_<date>.parquet.
+
+    Tables are streamed through a single pyarrow ParquetWriter, one row group
+    per part, using the union of the parts' columns (missing columns are
+    written as nulls). Part files are removed once the day file is written.
+    """
+    if not date_str:
+        return
+    part_paths = sorted(glob.glob(os.path.join(day_parts_dir(date_str), "part-*.parquet")))
+    if not part_paths:
+        return
+
+    path = day_file_path(date_str)
+    sources = ([path] if os.path.exists(path) else []) + part_paths
+    schema = pa.unify_schemas(
+        [pq.read_schema(p) for p in sources], promote_options="permissive"
+    )
+
+    tmp_path = f"{path}.tmp"
+    with pq.ParquetWriter(tmp_path, schema, compression="snappy") as writer:
+        for source in sources:
+            table = pq.read_table(source)
+            for field in schema:
+                if field.name not in table.column_names:
+                    table = table.append_column(field, pa.nulls(len(table), field.type))
+            writer.write_table(table.select(schema.names).cast(schema))
+    os.replace(tmp_path, path)
+
+    for part_path in part_paths:
+        os.remove(part_path)
+    os.rmdir(day_parts_dir(date_str))
+
+
+def compact_stale_days():
+    """
+    Compact part directories left from earlier days (e.g. after a crash).
+
+    Runs on the writer thread at startup, so nothing is created or read on
+    the caller's thread; days with no parts produce no file at all.
+    """
+    today = date.today().isoformat()
+    for parts_dir in glob.glob(os.path.join(PARQUET_DIR, "quotes_*")):
+        date_str = os.path.basename(parts_dir)[len("quotes_"):]
+        if os.path.isdir(parts_dir) and date_str < today:
+            compact_day(date_str)
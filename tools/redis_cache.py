@@ -2,6 +2,7 @@
 
 import os
 import redis
+import redis.asyncio
 from tools.config import get_config
 
 # ─── Load REDIS configuration from centralized config system ────────────────
@@ -12,9 +13,28 @@ REDIS_HOST = redis_config.get("host", "localhost")
 REDIS_PORT = redis_config.get("port", 6379)
 REDIS_DB = redis_config.get("db", 0)
 REDIS_TTL = redis_config.get("ttl", 600)
+REDIS_POOL_SIZE = redis_config.get("pool_size", 32)
 
-# initialize client
-r = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB)
+# initialize client on a shared, bounded connection pool; responses are
+# decoded to str by the client so callers never call .decode()
+pool = redis.BlockingConnectionPool(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    db=REDIS_DB,
+    max_connections=REDIS_POOL_SIZE,
+    decode_responses=True,
+)
+r = redis.Redis(connection_pool=pool)
+
+# asyncio client for callers running on an event loop; separate pool, same settings
+async_pool = redis.asyncio.ConnectionPool(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    db=REDIS_DB,
+    max_connections=REDIS_POOL_SIZE,
+    decode_responses=True,
+)
+ar = redis.asyncio.Redis(connection_pool=async_pool)
 
 def set_latest_quote(symbol: str, data: str):
     """
@@ -26,10 +46,35 @@ def set_latest_quote(symbol: str, data: str):
     key = f"SPX:QUOTE:{symbol}"
     r.set(key, data, ex=REDIS_TTL)
 
+def set_latest_quotes(items: dict[str, str]):
+    """
+    Overwrite the latest quote JSON for many symbols in a single round-trip.
+
+    Equivalent to calling set_latest_quote for each (symbol, data) pair, but
+    the SET commands are sent through one non-transactional pipeline.
+    """
+    if not items:
+        return
+    with r.pipeline(transaction=False) as pipe:
+        for symbol, data in items.items():
+            pipe.set(f"SPX:QUOTE:{symbol}", data, ex=REDIS_TTL)
+        pipe.execute()
+
+async def set_latest_quotes_async(items: dict[str, str]):
+    """
+    Async counterpart of set_latest_quotes: one pipelined round-trip per batch
+    without blocking the event loop.
+    """
+    if not items:
+        return
+    async with ar.pipeline(transaction=False) as pipe:
+        for symbol, data in items.items():
+            pipe.set(f"SPX:QUOTE:{symbol}", data, ex=REDIS_TTL)
+        await pipe.execute()
+
 def get_latest_quote(symbol: str) -> str | None:
     """
     Retrieve the most recent quote for a symbol, or None if it has expired.
     """
     key = f"SPX:QUOTE:{symbol}"
-    val = r.get(key)
-    return val.decode() if val else None
+    return r.get(key)
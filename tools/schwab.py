@@ -20,26 +20,147 @@ Classes:
 Dependencies:
 - httpx: For async HTTP requests
 - requests: For synchronous HTTP requests
+- orjson (optional): Faster parsing of quote responses
 - Database connection via tools.db
 - Email notifications via tools.emailer
 """
 
 import time
+import random
 import asyncio
+import functools
 import base64
 import httpx
 import os
 import math
+import json
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
-from urllib.parse import urlparse, parse_qs, unquote
+from requests.adapters import HTTPAdapter
+from sqlalchemy import String, bindparam, text
+from urllib.parse import urlparse, parse_qs, urlencode
 from tools.emailer import send_email
 from tools.db import DB
 from tools.schwab_endpoints import SCHWAB_ENDPOINTS
 from tools.decorators import retry_httpx
 from tools.config import get_config
-from datetime import datetime, date
+from tools.utils import get_dte_date_str
+from datetime import datetime, date, timezone
 from typing import List, Optional
 
+try:
+    # Optional: faster JSON parsing for large quote, chain and history responses
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# ─── SQL used by SchwabAPI ──────────────────────────────────────────────────
+# Built once at import and reused by every instance; the typed :name bind
+# keeps one parameter shape so SQL Server reuses a single cached plan.
+_NAME_BIND = bindparam("name", type_=String(10))
+
+_LOAD_ACCOUNT_HASH_SQL = text("""
+    SELECT TOP 1 account_hash, account_number, update_time
+    FROM SCHWAB.HASH
+    WHERE Name = :name
+    ORDER BY update_time DESC
+""").bindparams(_NAME_BIND)
+
+_LOAD_CREDENTIALS_SQL = text(
+    "SELECT client_id, client_secret, redirect_uri FROM OPT.SCHWAB.API WHERE Name=:name"
+).bindparams(_NAME_BIND)
+
+_LOAD_TOKENS_SQL = text(
+    "SELECT refresh_token, access_token, access_token_expires_at, refresh_token_expires_at "
+    "FROM OPT.SCHWAB.API WHERE Name=:name"
+).bindparams(_NAME_BIND)
+
+# Credentials, tokens and the latest account hash in one round trip
+_LOAD_INSTANCE_SQL = text("""
+    SELECT A.client_id, A.client_secret, A.redirect_uri,
+           A.refresh_token, A.access_token,
+           A.access_token_expires_at, A.refresh_token_expires_at,
+           H.account_hash
+    FROM OPT.SCHWAB.API A
+    OUTER APPLY (
+        SELECT TOP 1 account_hash
+        FROM SCHWAB.HASH
+        WHERE Name = A.Name
+        ORDER BY update_time DESC
+    ) H
+    WHERE A.Name = :name
+""").bindparams(_NAME_BIND)
+
+_SAVE_TOKENS_SQL = text("""
+    UPDATE OPT.SCHWAB.API
+    SET access_token=:access_token, refresh_token=:refresh_token,
+        access_token_expires_at=:access_exp, refresh_token_expires_at=:refresh_exp
+    WHERE Name=:name
+""").bindparams(_NAME_BIND)
+
+# Maximum option symbols per quotes request
+OPTION_QUOTES_CHUNK_SIZE = 250
+
+# Maximum concurrent price history requests for multi-symbol OHLC loads
+HISTORY_CONCURRENCY = 8
+
+# DTE windows a multi-day option chain request is split into (get_chains_sharded)
+CHAIN_SHARDS = 4
+
+# Seconds an account balance response is reused by get_account_balance
+BALANCE_CACHE_TTL = 1.5
+
+# Response bodies at least this large are decoded in a worker thread so the
+# event loop keeps servicing other in-flight requests (e.g. gathered chains)
+THREADED_DECODE_BYTES = 1_000_000
+
+# Column types of a price history candle. Declared up front so Arrow builds
+# typed columns directly instead of inferring a type from every value (and
+# whole-number prices still land as float64, matching the FLOAT columns)
+_CANDLE_SCHEMA = pa.schema([
+    ('open', pa.float64()),
+    ('high', pa.float64()),
+    ('low', pa.float64()),
+    ('close', pa.float64()),
+    ('volume', pa.int64()),
+    ('datetime', pa.int64()),  # epoch milliseconds
+])
+
+
+@functools.lru_cache(maxsize=8)
+def _bearer_headers(token: str) -> dict:
+    """
+    Authorization headers for an access token, built once per token.
+
+    Every request reuses the same dict until the token changes (refresh, or a
+    separate data/trade token re-read from the database). Callers must not
+    mutate it; httpx and requests copy headers into their own structures.
+    """
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _clean_symbol(symbol: str) -> str:
+    """Strip index prefixes ('$SPX' -> 'SPX', '^VIX' -> 'VIX'); plain symbols are returned as-is."""
+    return symbol.lstrip("$^") if symbol[:1] in ("$", "^") else symbol
+
+
+def _utc_datetime(epoch: float) -> datetime:
+    """Convert a Unix timestamp to the naive UTC datetime stored in SCHWAB.API."""
+    return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+
+
+def _utc_timestamp(dt: Optional[datetime]) -> float:
+    """Unix timestamp for a DB datetime; naive values are stored as UTC. None -> 0."""
+    if not dt:
+        return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
 
 class SchwabAPI:
     """
@@ -88,18 +209,15 @@ class SchwabAPI:
             # Dual API mode
             api = SchwabAPI("MAIN_DATA", data_name="DATA_API", trade_name="TRADE_API")
         """
-        self.db = DB()
+        self.db = DB.instance()
         self.name = name
         self.data_name = data_name or name
         self.trade_name = trade_name or name
 
-        # Load primary credentials and tokens
-        self.credentials = self.load_credentials()
+        # Load credentials, tokens and account hash in a single query
         self.tokens = {}
-        self.load_tokens_from_db()
-
-        # Load account hash for account-specific operations
-        self.account_hash = self.load_account_hash_from_db()
+        self._load_instance_from_db()
+        self._auth_headers = self._basic_auth_headers(self.credentials)
 
         # Load and validate environment configuration
         self._load_config()
@@ -107,6 +225,32 @@ class SchwabAPI:
         # Initialize data/trade specific attributes for SchwabClient compatibility
         self._init_data_trade_config()
 
+    def _load_instance_from_db(self):
+        """
+        Populate credentials, tokens and account hash from one database query.
+
+        Equivalent to calling load_credentials(), load_tokens_from_db() and
+        load_account_hash_from_db() in turn, but in a single round trip: the
+        latest SCHWAB.HASH row is joined onto the SCHWAB.API row with OUTER
+        APPLY, so a missing hash still returns the credentials.
+
+        Raises:
+            ValueError: If no credentials are found for the configured name
+        """
+        result = self.db.execute_query(_LOAD_INSTANCE_SQL, {"name": self.name})
+        if not result:
+            raise ValueError(f"No credentials found for {self.name}")
+
+        row = result[0]
+        self.credentials = self._credentials_from_row(row)
+        self.tokens = self._tokens_from_row(row)
+        self.account_hash = row.account_hash
+        if self.account_hash:
+            print(f"Loaded account hash for {self.name}: {self.account_hash[:8]}...")
+        else:
+            print(f"Warning: No account hash found in SCHWAB.HASH table for API name '{self.name}'")
+            print("Account-specific operations (balance, orders) will not work without an account hash.")
+
     def load_account_hash_from_db(self):
         """
         Load account hash from the SCHWAB.HASH table for account-specific API operations.
@@ -137,15 +281,8 @@ class SchwabAPI:
             The hash should be obtained and stored separately via the account
             numbers endpoint and hash extraction process.
         """
-        query = """
-            SELECT TOP 1 account_hash, account_number, update_time
-            FROM SCHWAB.HASH
-            WHERE Name = :name
-            ORDER BY update_time DESC
-        """
-
         try:
-            result = self.db.execute_query(query, {"name": self.name})
+            result = self.db.execute_query(_LOAD_ACCOUNT_HASH_SQL, {"name": self.name})
             if result:
                 # Return the account_hash from the most recent record
                 account_hash = result[0].account_hash
@@ -181,6 +318,7 @@ class SchwabAPI:
                 'max_retries': api_config.get('max_retries', 30),
                 'initial_retry_delay': api_config.get('initial_retry_delay', 1),
                 'http_timeout': api_config.get('http_timeout', 10),
+                'max_response_bytes': api_config.get('max_response_bytes', 50_000_000),
                 'refresh_threshold': tokens_config.get('refresh_threshold', 60)
             }
 
@@ -191,6 +329,8 @@ class SchwabAPI:
                 raise ValueError("initial_retry_delay must be greater than 0")
             if self.config['http_timeout'] <= 0:
                 raise ValueError("http_timeout must be greater than 0")
+            if self.config['max_response_bytes'] <= 0:
+                raise ValueError("max_response_bytes must be greater than 0")
             if self.config['refresh_threshold'] < 0:
                 raise ValueError("refresh_threshold must be non-negative")
 
@@ -208,10 +348,129 @@ class SchwabAPI:
         self.data_base_url = SCHWAB_ENDPOINTS.MARKET_DATA_BASE_URL
         self.trade_base_url = SCHWAB_ENDPOINTS.TRADING_BASE_URL
 
+        # Authorization URL only depends on the (fixed) credentials
+        self._token_uri = f"{SCHWAB_ENDPOINTS.oauth_authorize}?" + urlencode({
+            'client_id': self.credentials['client_id'],
+            'redirect_uri': self.credentials['redirect_uri'],
+        })
+
         # Initialize token cache for quick access
         self._token_data_cache = None
         self._token_trade_cache = None
 
+        # Whether data/trade use a separate API name is fixed for the life of
+        # the instance, so pick each token accessor once here
+        if self.data_name == self.name:
+            self._get_token_data = self._primary_token
+            self._set_token_data = self._set_primary_token
+        else:
+            self._get_token_data = functools.partial(
+                self._get_cached_token, self.data_name, '_token_data_cache')
+            self._set_token_data = functools.partial(
+                self._drop_cached_token, '_token_data_cache')
+        if self.trade_name == self.name:
+            self._get_token_trade = self._primary_token
+            self._set_token_trade = self._set_primary_token
+        else:
+            self._get_token_trade = functools.partial(
+                self._get_cached_token, self.trade_name, '_token_trade_cache')
+            self._set_token_trade = functools.partial(
+                self._drop_cached_token, '_token_trade_cache')
+
+        # Shared keep-alive session for synchronous requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0)
+        self._session.mount("https://", adapter)
+
+        # Shared async client, created lazily on the running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop = None
+
+        # Serializes token refreshes; bound to the running event loop
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._refresh_lock_loop = None
+
+        # Background loop refreshing the access token ahead of expiry
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # time.monotonic() value until which token_handler has nothing to do
+        self._token_deadline_mono = 0.0
+
+        # Per-instance offset added to the proactive refresh lead so instances
+        # whose tokens expire together don't all refresh on the same tick
+        self._refresh_jitter = random.uniform(0, 60)
+
+        # Most recent background write of refreshed tokens to the database
+        self._save_task: Optional[asyncio.Task] = None
+
+        # Short-lived account balance responses and in-flight requests, per account hash
+        self._balance_cache: dict[str, tuple[float, dict]] = {}
+        self._balance_inflight: dict[str, asyncio.Future] = {}
+
+    def close(self):
+        """
+        Close pooled HTTP connections held by this client.
+
+        Safe to call more than once; the client should not be used afterwards.
+        """
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
+    def __del__(self):
+        self.close()
+
+    async def _client(self) -> httpx.AsyncClient:
+        """
+        Return the shared httpx.AsyncClient, creating it on first use.
+
+        The client's connection pool belongs to the event loop it was created
+        on, so a new client is created when called from a different loop
+        (services that drive this instance with repeated asyncio.run calls).
+
+        Returns:
+            httpx.AsyncClient: Pooled client reused across requests
+        """
+        loop = asyncio.get_running_loop()
+        if (self._async_client is None or self._async_client.is_closed
+                or self._async_client_loop is not loop):
+            self._async_client = httpx.AsyncClient(
+                timeout=self.config['http_timeout'],
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100,
+                                    keepalive_expiry=30),
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _get_refresh_lock(self) -> asyncio.Lock:
+        """Return the token refresh lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._refresh_lock is None or self._refresh_lock_loop is not loop:
+            self._refresh_lock = asyncio.Lock()
+            self._refresh_lock_loop = loop
+        return self._refresh_lock
+
+    async def aclose(self):
+        """
+        Stop the background token refresher and close all pooled HTTP connections.
+
+        Instances built per call should be closed with this (or used as
+        ``async with SchwabAPI(...) as schwab:``) so their connection pools
+        are released.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
     def load_credentials(self):
         """
         Load API credentials from the database.
@@ -225,29 +484,32 @@ class SchwabAPI:
         Raises:
             ValueError: If no credentials are found for the configured name
         """
-        query = "SELECT client_id, client_secret, redirect_uri FROM OPT.SCHWAB.API WHERE Name=:name"
-        result = self.db.execute_query(query, {"name": self.name})
+        result = self.db.execute_query(_LOAD_CREDENTIALS_SQL, {"name": self.name})
         if result:
-            row = result[0]
-            return {
-                "client_id": row.client_id,
-                "client_secret": row.client_secret,
-                "redirect_uri": row.redirect_uri
-            }
+            return self._credentials_from_row(result[0])
         else:
             raise ValueError(f"No credentials found for {self.name}")
 
-    def build_headers(self):
+    @staticmethod
+    def _credentials_from_row(row) -> dict:
+        """Build the credentials dict from a SCHWAB.API result row."""
+        return {
+            "client_id": row.client_id,
+            "client_secret": row.client_secret,
+            "redirect_uri": row.redirect_uri
+        }
+
+    @staticmethod
+    def _basic_auth_headers(cred: dict) -> dict:
         """
-        Build HTTP headers for Schwab API authentication.
+        Build the OAuth2 Basic authentication headers for a set of client credentials.
 
-        Creates the Authorization header using Basic authentication with
-        base64-encoded client credentials as required by OAuth2 spec.
+        Args:
+            cred (dict): Credentials from load_credentials()
 
         Returns:
             dict: HTTP headers including Authorization and Content-Type
         """
-        cred = self.credentials
         # Encode client credentials for Basic authentication
         auth_string = f"{cred['client_id']}:{cred['client_secret']}"
         encoded_auth = base64.b64encode(auth_string.encode()).decode()
@@ -257,30 +519,61 @@ class SchwabAPI:
             'Content-Type': 'application/x-www-form-urlencoded'
         }
 
+    def build_headers(self):
+        """
+        Build HTTP headers for Schwab API authentication.
+
+        Creates the Authorization header using Basic authentication with
+        base64-encoded client credentials as required by OAuth2 spec.
+
+        Returns:
+            dict: HTTP headers including Authorization and Content-Type
+
+        Note:
+            Client credentials do not change for the life of the instance, so
+            the headers are encoded once at construction and the same dict is
+            returned on every call. Callers must not mutate it.
+        """
+        return self._auth_headers
+
     def save_tokens_to_db(self):
         """
         Save current OAuth2 tokens to the database.
 
         Updates the database record with current access_token, refresh_token,
-        and their respective expiration timestamps. Converts Unix timestamps
-        to database-compatible datetime format.
+        and their respective expiration timestamps. Unix timestamps are bound
+        as naive UTC datetimes.
         """
         data = self.tokens
-        query = """
-            UPDATE OPT.SCHWAB.API
-            SET access_token=:access_token, refresh_token=:refresh_token,
-                access_token_expires_at=:access_exp, refresh_token_expires_at=:refresh_exp
-            WHERE Name=:name
-        """
-        # Convert Unix timestamps to database datetime format
-        self.db.execute_non_query(query, {
+        # Bind expirations as naive UTC datetimes so the driver sends a native
+        # datetime instead of a string SQL Server has to convert
+        self.db.execute_non_query(_SAVE_TOKENS_SQL, {
             "access_token": data.get('access_token'),
             "refresh_token": data.get('refresh_token'),
-            "access_exp": time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(data.get('access_token_expires_at', 0))),
-            "refresh_exp": time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(data.get('refresh_token_expires_at', 0))),
+            "access_exp": _utc_datetime(data.get('access_token_expires_at', 0)),
+            "refresh_exp": _utc_datetime(data.get('refresh_token_expires_at', 0)),
             "name": self.name
         })
 
+    def _save_tokens_in_background(self):
+        """
+        Write the current tokens to the database without blocking the caller.
+
+        The UPDATE runs in a worker thread; the refreshed tokens are already in
+        memory, so the refresh coroutine returns without waiting for the DB.
+        save_tokens_to_db reads self.tokens when it runs, so the latest tokens
+        are written even if two saves overlap. asyncio.run() waits for worker
+        threads on shutdown, so a pending write is not lost when the loop ends.
+        """
+        task = asyncio.create_task(asyncio.to_thread(self.save_tokens_to_db))
+        task.add_done_callback(self._on_tokens_saved)
+        self._save_task = task
+
+    @staticmethod
+    def _on_tokens_saved(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            print(f"⚠️ Failed to save tokens to database: {task.exception()}")
+
     def load_tokens_from_db(self):
         """
         Load existing OAuth2 tokens from the database.
@@ -289,21 +582,24 @@ class SchwabAPI:
         Unix timestamps for internal use. If no tokens exist, initializes
         empty token dictionary.
         """
-        query = "SELECT refresh_token, access_token, access_token_expires_at, refresh_token_expires_at FROM OPT.SCHWAB.API WHERE Name=:name"
-        result = self.db.execute_query(query, {"name": self.name})
+        result = self.db.execute_query(_LOAD_TOKENS_SQL, {"name": self.name})
         if result:
-            row = result[0]
-            # Convert database datetime to Unix timestamp for internal use
-            self.tokens = {
-                'refresh_token': row.refresh_token,
-                'access_token': row.access_token,
-                'access_token_expires_at': (row.access_token_expires_at - datetime(1970, 1, 1)).total_seconds() if row.access_token_expires_at else 0,
-                'refresh_token_expires_at': (row.refresh_token_expires_at - datetime(1970, 1, 1)).total_seconds() if row.refresh_token_expires_at else 0
-            }
+            self.tokens = self._tokens_from_row(result[0])
         else:
             # Initialize empty tokens if none exist in database
             self.tokens = {}
 
+    @staticmethod
+    def _tokens_from_row(row) -> dict:
+        """Build the tokens dict from a SCHWAB.API result row."""
+        # Convert database datetime to Unix timestamp for internal use
+        return {
+            'refresh_token': row.refresh_token,
+            'access_token': row.access_token,
+            'access_token_expires_at': _utc_timestamp(row.access_token_expires_at),
+            'refresh_token_expires_at': _utc_timestamp(row.refresh_token_expires_at)
+        }
+
     def get_token_uri(self):
         """
         Generate the OAuth2 authorization URL for Schwab API.
@@ -313,10 +609,11 @@ class SchwabAPI:
 
         Returns:
             str: Complete authorization URL with client_id and redirect_uri parameters
+
+        Note:
+            Parameters are URL-encoded; the URL is built once at construction.
         """
-        credential = self.credentials
-        # Use proper OAuth endpoint
-        return f"{SCHWAB_ENDPOINTS.oauth_authorize}?client_id={credential['client_id']}&redirect_uri={credential['redirect_uri']}"
+        return self._token_uri
 
     @retry_httpx(max_retries=3, initial_delay=1)
     async def parse_uri_to_get_tokens(self, redirected_url):
@@ -329,6 +626,10 @@ class SchwabAPI:
         Args:
             redirected_url (str): The URL the user was redirected to after authorization
 
+        Raises:
+            ValueError: If the URL has no 'code' query parameter (logged and
+                swallowed by @retry_httpx, like other non-HTTP errors)
+
         Note:
             Automatically saves tokens to database and sets expiration times.
             Refresh token expires after 7 days (hardcoded value).
@@ -338,21 +639,26 @@ class SchwabAPI:
 
         # Parse the redirect URL to extract authorization code
         parsed_url = urlparse(redirected_url)
+        # parse_qs already percent-decodes values; decoding again would mangle
+        # codes that contain a literal '%'
         query_params = parse_qs(parsed_url.query)
-        authorization_code = query_params.get('code')[0]
+        codes = query_params.get('code')
+        if not codes:
+            raise ValueError(f"No authorization code found in redirect URL: {redirected_url}")
+        authorization_code = codes[0]
 
         # Prepare token exchange request
         headers = self.build_headers()
         data = {
             'grant_type': 'authorization_code',
-            'code': unquote(authorization_code),
+            'code': authorization_code,
             'redirect_uri': credential['redirect_uri']
         }
 
         # Exchange authorization code for tokens
-        async with httpx.AsyncClient(timeout=self.config['http_timeout']) as client:
-            response = await client.post(SCHWAB_ENDPOINTS.oauth_token, headers=headers, data=data)
-            response.raise_for_status()  # Raise exception for HTTP errors
+        client = await self._client()
+        response = await client.post(SCHWAB_ENDPOINTS.oauth_token, headers=headers, data=data)
+        response.raise_for_status()  # Raise exception for HTTP errors
 
         tokens_response = response.json()
         self.tokens.update(tokens_response)
@@ -362,7 +668,7 @@ class SchwabAPI:
         # Refresh token expiry is set by Schwab (7 days) - keep hardcoded
         self.tokens['refresh_token_expires_at'] = time.time() + 7 * 24 * 60 * 60  # 7 days
 
-        self.save_tokens_to_db()
+        self._save_tokens_in_background()
 
     @retry_httpx(max_retries=30, initial_delay=1)
     async def get_new_access_token(self):
@@ -375,31 +681,30 @@ class SchwabAPI:
         Features:
         - Retry logic handled by decorator with exponential backoff
         - Email notifications for failures
-        - Automatic token storage on success
+        - Automatic token storage on success (written in the background)
 
         Note:
             Retry configuration is handled by the @retry_httpx decorator.
         """
         headers = self.build_headers()
-        credentials = self.load_credentials()
 
-        # Prepare refresh token request
+        # Prepare refresh token request (credentials are cached on the instance)
         data = {
             "grant_type": "refresh_token",
-            "refresh_token": self.tokens.get("refresh_token", credentials.get("refresh_token", ""))
+            "refresh_token": self.tokens.get("refresh_token") or self.credentials.get("refresh_token", "")
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.config['http_timeout']) as client:
-                response = await client.post(SCHWAB_ENDPOINTS.oauth_token, headers=headers, data=data)
-                response.raise_for_status()  # Raise exception for HTTP errors
-
-                # Success: update tokens and save to database
-                tokens_response = response.json()
-                self.tokens.update(tokens_response)
-                self.tokens["access_token_expires_at"] = time.time() + tokens_response["expires_in"]
-                self.save_tokens_to_db()
-                return
+            client = await self._client()
+            response = await client.post(SCHWAB_ENDPOINTS.oauth_token, headers=headers, data=data)
+            response.raise_for_status()  # Raise exception for HTTP errors
+
+            # Success: update tokens and save to database
+            tokens_response = response.json()
+            self.tokens.update(tokens_response)
+            self.tokens["access_token_expires_at"] = time.time() + tokens_response["expires_in"]
+            self._save_tokens_in_background()
+            return
 
         except httpx.HTTPStatusError as e:
             # HTTP error: log and send email notification
@@ -424,26 +729,135 @@ class SchwabAPI:
 
         Logic:
         1. If refresh token is expired: Initiate full re-authorization flow
-        2. If access token is near expiry: Refresh using refresh token
+        2. If access token is near expiry (no background refresher, or it
+           failed): Refresh using refresh token
 
         Note:
             Configuration values are loaded from environment variables during initialization.
+            Expiry is checked without locking; only when a refresh looks needed is
+            the refresh lock taken and expiry re-checked, so concurrent callers
+            that see the same expired token trigger a single refresh.
+            Until the next point where any action could be needed, calls return
+            after a single monotonic clock comparison.
         """
-        # Use pre-loaded and validated configuration
-        refresh_threshold = self.config['refresh_threshold']
-        current_time = time.time()
-
-        # Calculate time until access token expires (minus threshold)
-        access_token_expires_in = self.tokens.get('access_token_expires_at', 0) - current_time - refresh_threshold
-
-        if current_time >= self.tokens.get('refresh_token_expires_at', 0):
-            # Refresh token has expired - need full re-authorization
-            print('Refresh Token Expired')
-            await self.get_new_refresh_token()
-        elif access_token_expires_in <= 0:
+        if time.monotonic() < self._token_deadline_mono:
+            return
+
+        if self._refresh_token_expired():
+            async with self._get_refresh_lock():
+                # Another coroutine may have re-authorized while we waited
+                if self._refresh_token_expired():
+                    # Refresh token has expired - need full re-authorization
+                    print('Refresh Token Expired')
+                    await self.get_new_refresh_token()
+        elif self._access_token_expiring():
             # Access token is near expiry - refresh using refresh token
             # Uncomment for debugging: print('Access Token Expired')
-            await self.get_new_access_token()
+            await self._refresh_access_token()
+
+        self._update_token_deadline()
+
+    def _update_token_deadline(self):
+        """
+        Recompute the monotonic deadline for token_handler's fast path.
+
+        The deadline is the earlier of the point where the access token needs
+        refreshing (refresh_threshold before expiry) and refresh-token expiry,
+        converted once from wall-clock to time.monotonic() so it is immune to
+        wall-clock steps. Refreshing earlier is the background loop's job
+        (start_background_refresh).
+        """
+        wall_deadline = min(
+            self.tokens.get('access_token_expires_at', 0) - self.config['refresh_threshold'],
+            self.tokens.get('refresh_token_expires_at', 0),
+        )
+        self._token_deadline_mono = time.monotonic() + (wall_deadline - time.time())
+
+    def start_background_refresh(self):
+        """
+        Start renewing the access token in the background ahead of expiry.
+
+        Meant for long-lived instances that own their tokens (tokens_service);
+        short-lived instances rely on token_handler alone. Does nothing if the
+        refresher is already running. Must be called from a running event loop.
+        """
+        task = self._refresh_task
+        if task is None or task.done():
+            self._refresh_task = asyncio.create_task(self._token_refresh_loop())
+
+    async def _token_refresh_loop(self):
+        """
+        Renew the access token in the background shortly before it expires.
+
+        Sleeps until _proactive_lead() seconds before access-token expiry, then
+        refreshes under the refresh lock, so the current token keeps serving
+        requests while the new one is fetched. Started by
+        start_background_refresh() and cancelled with its event loop
+        (asyncio.run) or by aclose(). Exits once the refresh token has
+        expired, since re-authorization is interactive and handled by
+        token_handler.
+        """
+        while not self._refresh_token_expired():
+            lead = self._proactive_lead()
+            sleep_for = self.tokens.get('access_token_expires_at', 0) - time.time() - lead
+            if sleep_for > 0:
+                await asyncio.sleep(sleep_for)
+            try:
+                await self._refresh_access_token(lead)
+            except Exception as e:
+                print(f"⚠️ Background token refresh failed: {str(e)}")
+            if self._access_token_expiring(lead):
+                # Refresh failed (get_new_access_token gives up quietly) -
+                # back off before trying again instead of spinning
+                await asyncio.sleep(30 + random.uniform(0, 15))
+            else:
+                self._update_token_deadline()
+
+    def _proactive_lead(self) -> float:
+        """Seconds before access expiry at which a background refresh starts."""
+        return 2 * self.config['refresh_threshold'] + self._refresh_jitter
+
+    async def _refresh_access_token(self, lead: Optional[float] = None):
+        """
+        Refresh the access token under the refresh lock if it is still expiring.
+
+        Args:
+            lead (float, optional): Seconds before expiry used for the re-check
+                (default: refresh_threshold)
+        """
+        async with self._get_refresh_lock():
+            if self._access_token_expiring(lead):
+                await self.get_new_access_token()
+
+    async def _refresh_after_unauthorized(self, attempt: int = 0):
+        """
+        Refresh the access token after a 401, after a jittered backoff.
+
+        The random delay spreads out instances (and concurrent requests) that
+        hit 401 at the same moment, so they don't stampede the token endpoint.
+        Requests that failed with the same token share one refresh: whoever
+        gets the refresh lock first refreshes, the rest see a new token and skip.
+
+        Args:
+            attempt (int): Number of previous refresh attempts for this request
+        """
+        stale_token = self.tokens.get('access_token')
+        delay = min(2 ** attempt, 30)
+        await asyncio.sleep(delay + random.uniform(0, delay * 0.5))
+        async with self._get_refresh_lock():
+            if self.tokens.get('access_token') == stale_token:
+                await self.get_new_access_token()
+
+    def _refresh_token_expired(self) -> bool:
+        """True if the refresh token has expired."""
+        return time.time() >= self.tokens.get('refresh_token_expires_at', 0)
+
+    def _access_token_expiring(self, lead: Optional[float] = None) -> bool:
+        """True if the access token expires within lead seconds (default: refresh threshold)."""
+        # Use pre-loaded and validated configuration
+        if lead is None:
+            lead = self.config['refresh_threshold']
+        return self.tokens.get('access_token_expires_at', 0) - time.time() - lead <= 0
 
     async def get_new_refresh_token(self):
         """
@@ -471,6 +885,38 @@ class SchwabAPI:
     # Token Access Properties (for SchwabClient compatibility)
     # ═══════════════════════════════════════════════════════════════════════════════
 
+    def _primary_token(self) -> str:
+        """Return the primary API access token."""
+        return self.tokens.get('access_token', '')
+
+    def _set_primary_token(self, token: str):
+        """Replace the primary API access token."""
+        self.tokens['access_token'] = token
+
+    def _drop_cached_token(self, cache_attr: str, token: str = None):
+        """Drop a cached token so the next access re-reads it from the database."""
+        setattr(self, cache_attr, None)
+
+    def _get_cached_token(self, api_name: str, cache_attr: str) -> str:
+        """
+        Return another API configuration's access token, cached until it nears expiry.
+
+        Args:
+            api_name (str): OPT.SCHWAB.API name to read the token for
+            cache_attr (str): Instance attribute holding the (token, expires_at) cache
+
+        Returns:
+            str: Access token for api_name
+        """
+        cached = getattr(self, cache_attr)
+        if cached is not None and time.time() < cached[1] - self.config['refresh_threshold']:
+            return cached[0]
+
+        # Cache empty or token due for refresh - read the current one from database
+        token, expires_at = self.db.get_token_with_expiry(api_name)
+        setattr(self, cache_attr, (token, expires_at))
+        return token
+
     @property
     def token_data(self) -> str:
         """
@@ -481,13 +927,23 @@ class SchwabAPI:
 
         Returns:
             str: Current access token for data operations
+
+        Note:
+            A separate data API token is read from the database and cached until
+            it is within refresh_threshold of expiry, rather than queried on
+            every request. The accessor is chosen once in _init_data_trade_config.
         """
-        if self.data_name != self.name:
-            # Using separate data API - get token from database
-            return self.db.get_token(self.data_name)
-        else:
-            # Using primary API for data operations
-            return self.tokens.get('access_token', '')
+        return self._get_token_data()
+
+    @token_data.setter
+    def token_data(self, token: str):
+        """
+        Replace the data API access token (e.g. after it was refreshed elsewhere).
+
+        With a separate data API the cached token is dropped, so the next access
+        re-reads the token and its expiry from the database.
+        """
+        self._set_token_data(token)
 
     @property
     def token_trade(self) -> str:
@@ -499,13 +955,16 @@ class SchwabAPI:
 
         Returns:
             str: Current access token for trading operations
+
+        Note:
+            A separate trade API token is cached the same way as token_data.
         """
-        if self.trade_name != self.name:
-            # Using separate trade API - get token from database
-            return self.db.get_token(self.trade_name)
-        else:
-            # Using primary API for trade operations
-            return self.tokens.get('access_token', '')
+        return self._get_token_trade()
+
+    @token_trade.setter
+    def token_trade(self, token: str):
+        """Replace the trade API access token; see token_data setter."""
+        self._set_token_trade(token)
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Synchronous Data Access Methods (from SchwabClient)
@@ -532,14 +991,14 @@ class SchwabAPI:
             streamer_info = prefs["streamerInfo"][0]
             socket_url = streamer_info["streamerSocketUrl"]
         """
-        resp = requests.get(
+        resp = self._session.get(
             SCHWAB_ENDPOINTS.user_preferences,
-            headers={"Authorization": f"Bearer {self.token_trade}"}
+            headers=_bearer_headers(self.token_trade)
         )
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
 
-    def get_option_quotes(self, symbols: list[str]) -> dict:
+    def get_option_quotes(self, symbols: list[str], chunk_size: int = OPTION_QUOTES_CHUNK_SIZE) -> dict:
         """
         Fetch option quotes for the specified symbols.
 
@@ -549,9 +1008,10 @@ class SchwabAPI:
         Args:
             symbols (list[str]): List of option symbols to fetch quotes for
                                (e.g., ['SPXW  241218C05000000', 'SPXW  241218P05000000'])
+            chunk_size (int): Maximum symbols per request (default: OPTION_QUOTES_CHUNK_SIZE)
 
         Returns:
-            dict: Option quote data from Schwab API
+            dict: Option quote data from Schwab API, keyed by symbol
 
         Raises:
             requests.HTTPError: If the API request fails
@@ -559,14 +1019,58 @@ class SchwabAPI:
         Example:
             api = SchwabAPI("MAIN_DATA")
             quotes = api.get_option_quotes(['SPXW  241218C05000000'])
+
+        Note:
+            Large symbol lists are requested chunk_size symbols at a time (keeping
+            URLs well under server limits) and the responses are merged.
+            Use get_option_quotes_async() to fetch the chunks concurrently.
         """
-        resp = requests.get(
-            SCHWAB_ENDPOINTS.option_quotes,
-            headers={"Authorization": f"Bearer {self.token_data}"},
-            params={"symbols": ",".join(symbols)}
-        )
-        resp.raise_for_status()
-        return resp.json()
+        headers = _bearer_headers(self.token_data)
+        quotes = {}
+        for i in range(0, len(symbols), chunk_size):
+            resp = self._session.get(
+                SCHWAB_ENDPOINTS.option_quotes,
+                headers=headers,
+                params={"symbols": ",".join(symbols[i:i + chunk_size])}
+            )
+            resp.raise_for_status()
+            quotes.update(_json_loads(resp.content))
+        return quotes
+
+    async def get_option_quotes_async(self, symbols: list[str], chunk_size: int = OPTION_QUOTES_CHUNK_SIZE) -> dict:
+        """
+        Fetch option quotes for the specified symbols, requesting chunks concurrently.
+
+        Async counterpart of get_option_quotes(): the symbol list is split into
+        chunks of chunk_size and all chunks are requested at once over the shared
+        async client, so wall time is roughly one round-trip instead of one per chunk.
+        Each chunk goes through _get (401 refresh, threaded decode of large bodies).
+
+        Args:
+            symbols (list[str]): List of option symbols to fetch quotes for
+            chunk_size (int): Maximum symbols per request (default: OPTION_QUOTES_CHUNK_SIZE)
+
+        Returns:
+            dict: Option quote data from Schwab API, keyed by symbol
+
+        Raises:
+            httpx.HTTPStatusError: If any chunk request fails
+
+        Example:
+            api = SchwabAPI("MAIN_DATA")
+            quotes = await api.get_option_quotes_async(generate_spxw_symbols(5000.0))
+        """
+        responses = await asyncio.gather(*(
+            self._get(SCHWAB_ENDPOINTS.option_quotes,
+                      params={"symbols": ",".join(symbols[i:i + chunk_size])},
+                      what="option quotes")
+            for i in range(0, len(symbols), chunk_size)
+        ))
+
+        quotes = {}
+        for data in responses:
+            quotes.update(data)
+        return quotes
 
     def get_underlying_quote(self, symbol: str) -> float:
         """
@@ -590,27 +1094,89 @@ class SchwabAPI:
             spx_price = api.get_underlying_quote('$SPX')
             print(f"SPX last price: {spx_price}")
         """
-        resp = requests.get(
+        resp = self._session.get(
             SCHWAB_ENDPOINTS.quotes,
-            headers={"Authorization": f"Bearer {self.token_data}"},
+            headers=_bearer_headers(self.token_data),
             params={"symbols": symbol}
         )
         resp.raise_for_status()
-        data = resp.json()  # e.g. {"$SPX": { ..., "quote": { "lastPrice": 5921.54, ... } }}
+        data = _json_loads(resp.content)  # e.g. {"$SPX": { ..., "quote": { "lastPrice": 5921.54, ... } }}
 
-        # Pull out the entry for our symbol
-        entry = data.get(symbol)
-        if not entry:
-            # If it comes under a "quotes" or "data" list, fall back
-            for key in ("quotes", "data"):
-                if key in data and isinstance(data[key], list) and data[key]:
-                    entry = data[key][0]
-                    break
+        # Pull out the entry for our symbol; if it comes under a "quotes" or
+        # "data" list, fall back to the first element
+        entry = data.get(symbol) or next(
+            (data[key][0] for key in ("quotes", "data") if isinstance(data.get(key), list) and data[key]),
+            None
+        )
 
-        if not entry or "quote" not in entry or "lastPrice" not in entry["quote"]:
-            raise ValueError(f"No quote data returned for symbol {symbol!r}: {data!r}")
+        try:
+            return float(entry["quote"]["lastPrice"])
+        except (KeyError, TypeError):
+            raise ValueError(f"No quote data returned for symbol {symbol!r}: {data!r}") from None
+
+    async def _get(self, url: str, *, trade: bool = False, params: Optional[dict] = None,
+                   what: str = "data", limit: Optional[int] = None):
+        """
+        GET a Schwab API endpoint and return the decoded JSON body.
 
-        return float(entry["quote"]["lastPrice"])
+        The single request path for the async data/trade methods: picks the
+        bearer token, retries once after a 401 (refreshing the primary token,
+        or re-reading a separate data/trade API's token from the database),
+        and decodes the body with _json_loads. Bodies of THREADED_DECODE_BYTES
+        or more are decoded in a worker thread instead of on the event loop.
+
+        Args:
+            url (str): Endpoint URL
+            trade (bool): Authenticate with the trade token instead of the data token
+            params (dict, optional): Query parameters
+            what (str): Description of the request for error messages
+            limit (int, optional): Stream the body and reject it above this many bytes
+
+        Returns:
+            Decoded JSON response (dict or list)
+
+        Raises:
+            httpx.HTTPError: Transport errors and non-2xx responses, unwrapped so
+                @retry_httpx on the calling method can classify them
+            Exception: Other failures (e.g. undecodable body), with context
+        """
+        client = await self._client()
+        for attempt in range(2):
+            headers = _bearer_headers(self.token_trade if trade else self.token_data)
+            try:
+                if limit is None:
+                    resp = await client.get(url, headers=headers, params=params)
+                    resp.raise_for_status()
+                    body = resp.content
+                else:
+                    async with client.stream('GET', url, headers=headers, params=params) as resp:
+                        if resp.is_error:
+                            await resp.aread()  # so the error body is available to handlers
+                        resp.raise_for_status()
+                        body = await self._read_limited(resp, limit)
+                if len(body) >= THREADED_DECODE_BYTES:
+                    return await asyncio.to_thread(_json_loads, body)
+                return _json_loads(body)
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 401 and attempt == 0:
+                    if (self.trade_name if trade else self.data_name) != self.name:
+                        # Another API's cached token was rejected - drop it so the
+                        # retry re-reads the token its own service has refreshed
+                        if trade:
+                            self._set_token_trade(None)
+                        else:
+                            self._set_token_data(None)
+                    else:
+                        # Token expired - refresh and retry once with the new token
+                        await self._refresh_after_unauthorized()
+                    continue
+                raise
+            except httpx.HTTPError:
+                raise
+            except Exception as e:
+                # Re-raise with more context for debugging
+                raise Exception(f"Error fetching {what}: {str(e)}") from e
 
     async def get_accounts(self) -> list:
         """
@@ -626,7 +1192,7 @@ class SchwabAPI:
                 - hashValue: The encrypted account hash (64 characters)
 
         Raises:
-            requests.HTTPError: If the API request fails
+            httpx.HTTPStatusError: If the API request fails
             Exception: If token refresh is needed and fails
 
         Example:
@@ -639,40 +1205,7 @@ class SchwabAPI:
             This method uses the trade token for authentication and may trigger
             automatic token refresh if the current token is expired.
         """
-        import requests
-
-        try:
-            # Make request to account numbers endpoint
-            resp = requests.get(
-                SCHWAB_ENDPOINTS.account_numbers,
-                headers={"Authorization": f"Bearer {self.token_trade}"}
-            )
-            resp.raise_for_status()
-            return resp.json()
-
-        except requests.HTTPError as e:
-            if e.response.status_code == 401:
-                # Token expired - attempt refresh and retry once
-                try:
-                    await self.get_new_access_token()
-                    # Retry the request with refreshed token
-                    resp = requests.get(
-                        SCHWAB_ENDPOINTS.account_numbers,
-                        headers={"Authorization": f"Bearer {self.token_trade}"}
-                    )
-                    resp.raise_for_status()
-                    return resp.json()
-
-                except Exception as refresh_error:
-                    raise Exception(f"Failed to refresh token and retry accounts request: {str(refresh_error)}") from refresh_error
-            else:
-                # Re-raise other HTTP errors
-                raise
-        except Exception as e:
-            # Re-raise with more context for debugging
-            if not isinstance(e, requests.HTTPError):
-                raise Exception(f"Error fetching accounts: {str(e)}") from e
-            raise
+        return await self._get(SCHWAB_ENDPOINTS.account_numbers, trade=True, what="accounts")
 
     def get_account_hash(self, accounts_response: list, account_number: str) -> str:
         """
@@ -730,23 +1263,24 @@ class SchwabAPI:
                 - positions: List of current positions (if any)
 
         Raises:
-            ValueError: If no account hash is available or no account data is returned
-            requests.HTTPError: If the API request fails
-            Exception: If token refresh is needed and fails
+            ValueError: If no account hash is available
 
         Example:
             api = SchwabAPI("MAIN_TRADE")
             account_data = await api.get_account_balance()
-            account_info = account_data.get("securitiesAccount", {})
-            balance_info = account_info.get("currentBalances", {})
-            buying_power = balance_info.get("dayTradingBuyingPower")
+            account_info, balance_info = account_balance_sections(account_data)
+            buying_power = balance_info["dayTradingBuyingPower"]
 
         Note:
             This method requires an account hash to be loaded from the SCHWAB.HASH table.
             If no hash is available, the method will attempt to reload it once.
+            The request itself (_fetch_account_balance) is wrapped in @retry_httpx:
+            timeouts and 5xx responses are retried, and final failures or an
+            empty response are logged and return None.
+            Responses are reused for BALANCE_CACHE_TTL seconds, and concurrent
+            callers share one in-flight request, so bursts of balance checks
+            cost a single round trip. Treat the returned dict as read-only.
         """
-        import requests
-
         # Ensure we have an account hash
         if not self.account_hash:
             print("No account hash available, attempting to reload from database...")
@@ -756,52 +1290,30 @@ class SchwabAPI:
             raise ValueError("Cannot fetch account balance: No account hash available. "
                            "Ensure the SCHWAB.HASH table contains a record for this API name.")
 
-        try:
-            # Make request to specific account endpoint using account hash
-            account_url = SCHWAB_ENDPOINTS.account_by_number(self.account_hash)
-            resp = requests.get(
-                account_url,
-                headers={"Authorization": f"Bearer {self.token_trade}"}
-            )
-            resp.raise_for_status()
+        account_hash = self.account_hash
+        cached = self._balance_cache.get(account_hash)
+        if cached is not None and time.monotonic() - cached[0] < BALANCE_CACHE_TTL:
+            return cached[1]
 
-            # Parse response
-            account_data = resp.json()
-
-            if not account_data:
-                raise ValueError("No account data returned from Schwab API")
-
-            return account_data
-
-        except requests.HTTPError as e:
-            if e.response.status_code == 401:
-                # Token expired - attempt refresh and retry once
-                try:
-                    await self.get_new_access_token()
-                    # Retry the request with refreshed token
-                    account_url = SCHWAB_ENDPOINTS.account_by_number(self.account_hash)
-                    resp = requests.get(
-                        account_url,
-                        headers={"Authorization": f"Bearer {self.token_trade}"}
-                    )
-                    resp.raise_for_status()
-                    account_data = resp.json()
+        # Single flight: concurrent callers await the request already in progress
+        task = self._balance_inflight.get(account_hash)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._fetch_account_balance(account_hash))
+            self._balance_inflight[account_hash] = task
+        return await asyncio.shield(task)
 
-                    if not account_data:
-                        raise ValueError("No account data returned from Schwab API after token refresh")
+    @retry_httpx(max_retries=3, initial_delay=1)
+    async def _fetch_account_balance(self, account_hash: str) -> dict:
+        """Request an account's balance and positions and cache the response (see get_account_balance)."""
+        # Make request to specific account endpoint using account hash
+        account_url = SCHWAB_ENDPOINTS.account_by_number(account_hash)
+        account_data = await self._get(account_url, trade=True, what="account balance")
 
-                    return account_data
+        if not account_data:
+            raise ValueError("No account data returned from Schwab API")
 
-                except Exception as refresh_error:
-                    raise Exception(f"Failed to refresh token and retry account balance request: {str(refresh_error)}") from refresh_error
-            else:
-                # Re-raise other HTTP errors
-                raise
-        except Exception as e:
-            # Re-raise with more context for debugging
-            if not isinstance(e, (requests.HTTPError, ValueError)):
-                raise Exception(f"Error fetching account balance: {str(e)}") from e
-            raise
+        self._balance_cache[account_hash] = (time.monotonic(), account_data)
+        return account_data
 
     @retry_httpx(max_retries=3, initial_delay=1)
     async def get_markets(self, markets: str, date) -> dict:
@@ -838,33 +1350,14 @@ class SchwabAPI:
         await self.token_handler()
 
         # Format date as string for API parameter
-        date_str = date.strftime('%Y-%m-%d') if hasattr(date, 'strftime') else str(date)
+        date_str = date.isoformat() if hasattr(date, 'isoformat') else str(date)
 
-        try:
-            # Make request to market hours endpoint
-            async with httpx.AsyncClient(timeout=self.config['http_timeout']) as client:
-                resp = await client.get(
-                    SCHWAB_ENDPOINTS.market_hours,
-                    headers={"Authorization": f"Bearer {self.token_data}"},
-                    params={'markets': markets, 'date': date_str}
-                )
-                resp.raise_for_status()
-                return resp.json()
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                # Token expired - attempt refresh and retry
-                await self.get_new_access_token()
-                # Re-raise to trigger decorator retry with refreshed token
-                raise
-            else:
-                # Re-raise other HTTP errors
-                raise
-        except Exception as e:
-            # Re-raise with more context for debugging
-            if not isinstance(e, httpx.HTTPStatusError):
-                raise Exception(f"Error fetching market hours: {str(e)}") from e
-            raise
+        # Make request to market hours endpoint
+        return await self._get(
+            SCHWAB_ENDPOINTS.market_hours,
+            params={'markets': markets, 'date': date_str},
+            what="market hours",
+        )
 
     @retry_httpx(max_retries=3, initial_delay=1)
     async def get_history(self, symbol: str, period: int, periodType: str, frequency: int, frequencyType: str) -> dict:
@@ -901,44 +1394,157 @@ class SchwabAPI:
         # Ensure we have valid tokens
         await self.token_handler()
 
-        try:
-            # Make request to price history endpoint
-            async with httpx.AsyncClient(timeout=self.config['http_timeout']) as client:
-                resp = await client.get(
-                    SCHWAB_ENDPOINTS.price_history,
-                    headers={"Authorization": f"Bearer {self.token_data}"},
-                    params={
-                        "symbol": symbol,
-                        "period": period,
-                        "periodType": periodType,
-                        "frequency": frequency,
-                        "frequencyType": frequencyType
-                    }
-                )
-                resp.raise_for_status()
-                return resp.json()
+        # Make request to price history endpoint
+        return await self._get(
+            SCHWAB_ENDPOINTS.price_history,
+            params={
+                "symbol": symbol,
+                "period": period,
+                "periodType": periodType,
+                "frequency": frequency,
+                "frequencyType": frequencyType
+            },
+            what=f"price history for {symbol}",
+        )
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                # Token expired - attempt refresh and retry
-                await self.get_new_access_token()
-                # Re-raise to trigger decorator retry with refreshed token
-                raise
+    # Price history requests per OHLC table load (minute and daily)
+    _HISTORY_PARAMS = {
+        'MINUTE': dict(period=10, periodType='day', frequency=1, frequencyType='minute'),
+        'DAY': dict(period=2, periodType='month', frequency=1, frequencyType='daily'),
+    }
+
+    @staticmethod
+    def _history_rows(symbol: str, candles: list, freq: str) -> list:
+        """
+        Build the PYTHON.MINUTE / PYTHON.DAY rows for one symbol's candles.
+
+        The timestamp conversion runs column-wise in Arrow compute kernels
+        rather than per row (or through a pandas DataFrame).
+
+        Args:
+            symbol (str): The symbol the candles belong to (e.g., '$SPX')
+            candles (list): 'candles' array from get_history()
+            freq (str): 'MINUTE' (timestamps in Pacific Time) or 'DAY' (adds a date column)
+
+        Returns:
+            list: Row dicts ready for DB.insert_candles()
+        """
+        table = pa.Table.from_pylist(candles, schema=_CANDLE_SCHEMA)
+
+        # Convert datetime from epoch milliseconds. Arrow timestamps always hold
+        # UTC epoch values, so the int64 column is reinterpreted directly in the
+        # target zone (no intermediate UTC column) and converted in one kernel pass
+        epoch_ms = table['datetime']
+        columns = {name: table[name] for name in ('open', 'high', 'low', 'close', 'volume')}
+        if freq == 'MINUTE':
+            # Minute bars are stored as naive Pacific Time
+            columns['datetime'] = pc.local_timestamp(epoch_ms.cast(pa.timestamp('ms', tz='America/Los_Angeles')))
+        else:
+            # Daily bars are stored as naive UTC
+            columns['datetime'] = epoch_ms.cast(pa.timestamp('ms'))
+            columns['date'] = columns['datetime'].cast(pa.date32())
+
+        n = table.num_rows
+        columns['Symbol'] = pa.repeat(_clean_symbol(symbol), n)
+        columns['freq'] = pa.repeat(freq, n)
+        return pa.table(columns).to_pylist()
+
+    async def _historic_quotes_to_sql(self, symbols: List[str], freq: str, concurrency: int) -> int:
+        """
+        Fetch price history for several symbols concurrently and store it in one insert.
+
+        Args:
+            symbols (List[str]): Symbols to fetch (e.g., ['$SPX', '$VIX'])
+            freq (str): 'MINUTE' or 'DAY'; selects request parameters and target table
+            concurrency (int): Maximum number of history requests in flight
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            Exception: If the database insert fails
+
+        Note:
+            A symbol whose request fails or returns no candles is reported and
+            skipped; the remaining symbols are still stored.
+        """
+        label = freq.lower()
+        params = self._HISTORY_PARAMS[freq]
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(symbol):
+            async with sem:
+                print(f"🔑 Getting historic {label} quotes: {symbol}")
+                result = await self.get_history(symbol, **params)
+            if not result or not result.get('candles'):
+                return None
+            # Build rows off the event loop while other symbols are still downloading
+            return await asyncio.to_thread(self._history_rows, symbol, result['candles'], freq)
+
+        results = await asyncio.gather(*(fetch(s) for s in symbols), return_exceptions=True)
+
+        rows = []
+        stored = 0
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error fetching {label} data for {symbol}: {str(result)}")
+            elif not result:
+                print(f"No {label} data available for {symbol}")
             else:
-                # Re-raise other HTTP errors
-                raise
-        except Exception as e:
-            # Re-raise with more context for debugging
-            if not isinstance(e, httpx.HTTPStatusError):
-                raise Exception(f"Error fetching price history for {symbol}: {str(e)}") from e
-            raise
+                rows.extend(result)
+                stored += 1
+
+        if not rows:
+            return 0
+
+        # Store all symbols in a single batch
+        self.db.insert_candles(freq, rows)
+        print(f"✅ Stored {len(rows)} {label} records for {stored} symbol(s)")
+        return len(rows)
+
+    async def get_historic_quotes_to_sql_minute(self, symbols: List[str], concurrency: int = HISTORY_CONCURRENCY) -> int:
+        """
+        Fetch minute-level historical data for several symbols and store in SQL database.
+
+        Retrieves 10 days of minute-level OHLC data per symbol, with up to
+        `concurrency` requests in flight, and writes every symbol's rows to
+        PYTHON.MINUTE in one insert batch.
+
+        Args:
+            symbols (List[str]): Symbols to fetch data for (e.g., ['$SPX', '$VIX'])
+            concurrency (int): Maximum concurrent history requests
+
+        Returns:
+            int: Number of rows written
+
+        Example:
+            api = SchwabAPI("MAIN_DATA")
+            await api.get_historic_quotes_to_sql_minute(['$SPX', '$VIX'])
+        """
+        return await self._historic_quotes_to_sql(symbols, 'MINUTE', concurrency)
+
+    async def get_historic_quotes_to_sql_day(self, symbols: List[str], concurrency: int = HISTORY_CONCURRENCY) -> int:
+        """
+        Fetch daily historical data for several symbols and store in SQL database.
+
+        Daily counterpart of get_historic_quotes_to_sql_minute(): 2 months of
+        daily OHLC data per symbol, written to PYTHON.DAY in one insert batch.
+
+        Args:
+            symbols (List[str]): Symbols to fetch data for (e.g., ['$SPX', '$VIX'])
+            concurrency (int): Maximum concurrent history requests
+
+        Returns:
+            int: Number of rows written
+        """
+        return await self._historic_quotes_to_sql(symbols, 'DAY', concurrency)
 
     async def get_historic_quote_to_sql_minute(self, symbol: str):
         """
         Fetch minute-level historical data and store in SQL database.
 
         Retrieves 10 days of minute-level OHLC data for the specified symbol
-        and stores it in the database using the df_to_sql method.
+        and stores it in the database using DB.insert_candles().
 
         Args:
             symbol (str): The symbol to fetch data for (e.g., '$SPX', '$VIX')
@@ -948,29 +1554,23 @@ class SchwabAPI:
             - Converting timestamps to Pacific Time
             - Adding symbol and frequency metadata
             - Storing in the PYTHON.MINUTE table
+            Use get_historic_quotes_to_sql_minute() for several symbols.
         """
         print(f"🔑 Getting historic minute quotes: {symbol}")
 
         try:
             # Fetch 10 days of minute data
-            result = await self.get_history(symbol, period=10, periodType='day', frequency=1, frequencyType='minute')
+            result = await self.get_history(symbol, **self._HISTORY_PARAMS['MINUTE'])
 
-            if not result or 'candles' not in result:
+            if not result or not result.get('candles'):
                 print(f"No minute data available for {symbol}")
                 return
 
-            # Convert to DataFrame and process
-            import pandas as pd
-            df = pd.DataFrame.from_records(result['candles'])
-
-            # Convert datetime from milliseconds to Pacific Time
-            df['datetime'] = pd.to_datetime(df['datetime'], utc=True, unit='ms').dt.tz_convert('America/Los_Angeles').dt.tz_localize(None)
-            df['Symbol'] = symbol.lstrip("$^")  # Remove $ and ^ prefixes
-            df['freq'] = 'MINUTE'
+            rows = await asyncio.to_thread(self._history_rows, symbol, result['candles'], 'MINUTE')
 
             # Store in database
-            self.db.df_to_sql(df, 'MINUTE', if_exists='append', schema_name='PYTHON')
-            print(f"✅ Stored {len(df)} minute records for {symbol}")
+            self.db.insert_candles('MINUTE', rows)
+            print(f"✅ Stored {len(rows)} minute records for {symbol}")
 
         except Exception as e:
             print(f"❌ Error fetching minute data for {symbol}: {str(e)}")
@@ -981,7 +1581,7 @@ class SchwabAPI:
         Fetch daily historical data and store in SQL database.
 
         Retrieves 2 months of daily OHLC data for the specified symbol
-        and stores it in the database using the df_to_sql method.
+        and stores it in the database using DB.insert_candles().
 
         Args:
             symbol (str): The symbol to fetch data for (e.g., '$SPX', '$VIX')
@@ -991,30 +1591,23 @@ class SchwabAPI:
             - Converting timestamps to date format
             - Adding symbol and frequency metadata
             - Storing in the PYTHON.DAY table
+            Use get_historic_quotes_to_sql_day() for several symbols.
         """
         print(f"🔑 Getting historic day quotes: {symbol}")
 
         try:
             # Fetch 2 months of daily data
-            result = await self.get_history(symbol, period=2, periodType='month', frequency=1, frequencyType='daily')
+            result = await self.get_history(symbol, **self._HISTORY_PARAMS['DAY'])
 
-            if not result or 'candles' not in result:
+            if not result or not result.get('candles'):
                 print(f"No daily data available for {symbol}")
                 return
 
-            # Convert to DataFrame and process
-            import pandas as pd
-            df = pd.DataFrame.from_records(result['candles'])
-
-            # Convert datetime from milliseconds and extract date
-            df['datetime'] = pd.to_datetime(df['datetime'], utc=True, unit='ms').dt.tz_localize(None)
-            df['date'] = df['datetime'].dt.date
-            df['Symbol'] = symbol.lstrip("$^")  # Remove $ and ^ prefixes
-            df['freq'] = 'DAY'
+            rows = await asyncio.to_thread(self._history_rows, symbol, result['candles'], 'DAY')
 
             # Store in database
-            self.db.df_to_sql(df, 'DAY', if_exists='append', schema_name='PYTHON')
-            print(f"✅ Stored {len(df)} daily records for {symbol}")
+            self.db.insert_candles('DAY', rows)
+            print(f"✅ Stored {len(rows)} daily records for {symbol}")
 
         except Exception as e:
             print(f"❌ Error fetching daily data for {symbol}: {str(e)}")
@@ -1055,32 +1648,13 @@ class SchwabAPI:
         # Ensure we have valid tokens
         await self.token_handler()
 
-        try:
-            # Make request to account orders endpoint
-            orders_url = SCHWAB_ENDPOINTS.account_orders(account_hash)
-            async with httpx.AsyncClient(timeout=self.config['http_timeout']) as client:
-                resp = await client.get(
-                    orders_url,
-                    headers={"Authorization": f"Bearer {self.token_trade}"},
-                    params={"fromEnteredTime": start_date, "toEnteredTime": end_date}
-                )
-                resp.raise_for_status()
-                return resp.json()
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                # Token expired - attempt refresh and retry
-                await self.get_new_access_token()
-                # Re-raise to trigger decorator retry with refreshed token
-                raise
-            else:
-                # Re-raise other HTTP errors
-                raise
-        except Exception as e:
-            # Re-raise with more context for debugging
-            if not isinstance(e, httpx.HTTPStatusError):
-                raise Exception(f"Error fetching orders for account {account_hash}: {str(e)}") from e
-            raise
+        # Make request to account orders endpoint
+        return await self._get(
+            SCHWAB_ENDPOINTS.account_orders(account_hash),
+            trade=True,
+            params={"fromEnteredTime": start_date, "toEnteredTime": end_date},
+            what=f"orders for account {account_hash}",
+        )
 
     @retry_httpx(max_retries=3, initial_delay=1)
     async def get_chains(self, symbol: str, fromDTE: int, toDTE: int, strikeCount: int) -> dict:
@@ -1116,45 +1690,130 @@ class SchwabAPI:
         Note:
             This method uses the data token for authentication and automatic retry
             logic is handled by the @retry_httpx decorator.
-            The fromDate and toDate parameters are calculated using get_dte_date().
+            The fromDate and toDate parameters are calculated using get_dte_date_str().
+            Responses larger than schwab_api.max_response_bytes are rejected
+            with a ValueError; fetch wide DTE ranges with get_chains_sharded().
         """
-        from tools.utils import get_dte_date
-
         # Ensure we have valid tokens
         await self.token_handler()
 
-        try:
-            # Make request to option chains endpoint
-            async with httpx.AsyncClient(timeout=self.config['http_timeout']) as client:
-                resp = await client.get(
-                    SCHWAB_ENDPOINTS.option_chains,
-                    headers={"Authorization": f"Bearer {self.token_data}"},
-                    params={
-                        'symbol': symbol,
-                        'fromDate': get_dte_date(fromDTE).strftime('%Y-%m-%d'),
-                        'toDate': get_dte_date(toDTE).strftime('%Y-%m-%d'),
-                        'strikeCount': strikeCount
-                    }
-                )
-                resp.raise_for_status()
-                return resp.json()
+        # Make request to option chains endpoint; the body is streamed so an
+        # oversize chain is rejected before it is fully buffered and parsed
+        return await self._get(
+            SCHWAB_ENDPOINTS.option_chains,
+            params={
+                'symbol': symbol,
+                'fromDate': get_dte_date_str(fromDTE),
+                'toDate': get_dte_date_str(toDTE),
+                'strikeCount': strikeCount
+            },
+            what=f"option chains for {symbol}",
+            limit=self.config['max_response_bytes'],
+        )
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                # Token expired - attempt refresh and retry
-                await self.get_new_access_token()
-                # Re-raise to trigger decorator retry with refreshed token
-                raise
-            else:
-                # Re-raise other HTTP errors
-                raise
-        except Exception as e:
-            # Re-raise with more context for debugging
-            if not isinstance(e, httpx.HTTPStatusError):
-                raise Exception(f"Error fetching option chains for {symbol}: {str(e)}") from e
-            raise
+    @staticmethod
+    async def _read_limited(resp: httpx.Response, limit: int) -> bytes:
+        """
+        Read a streamed response body, refusing bodies larger than limit bytes.
+
+        Checks Content-Length up front when the server sends it, and otherwise
+        stops reading as soon as the running total passes the limit, so peak
+        memory stays bounded either way.
+
+        Args:
+            resp (httpx.Response): Response opened with client.stream()
+            limit (int): Maximum body size in bytes
+
+        Returns:
+            bytes: The complete (decoded) response body
+
+        Raises:
+            ValueError: If the body exceeds limit bytes
+        """
+        too_large = f"Response from {resp.url.path} exceeds {limit} bytes"
+        length = resp.headers.get('content-length')
+        if length is not None and length.isdigit() and int(length) > limit:
+            raise ValueError(too_large)
+
+        body = bytearray()
+        async for chunk in resp.aiter_bytes():
+            body += chunk
+            if len(body) > limit:
+                raise ValueError(too_large)
+        return bytes(body)
+
+    async def get_chains_sharded(self, symbol: str, fromDTE: int, toDTE: int, strikeCount: int,
+                                 shards: int = CHAIN_SHARDS) -> Optional[dict]:
+        """
+        Fetch option chains for a wide DTE range as parallel sub-window requests.
+
+        Splits [fromDTE, toDTE] into up to `shards` contiguous DTE windows,
+        fetches them concurrently with get_chains(), and merges the
+        callExpDateMap/putExpDateMap of every window into one response. Smaller
+        responses avoid Schwab's "Body buffer overflow" fault on large chains
+        and are parsed in parallel with the remaining downloads.
+
+        Args:
+            symbol (str): The underlying symbol (e.g., '$SPX', 'AAPL')
+            fromDTE (int): Starting days to expiration (0 = today)
+            toDTE (int): Ending days to expiration
+            strikeCount (int): Number of strikes to retrieve around current price
+            shards (int): Maximum number of DTE windows (default: CHAIN_SHARDS)
+
+        Returns:
+            Optional[dict]: Same shape as get_chains(); None if any window failed.
+                A window's API fault response is returned as-is.
+
+        Example:
+            api = SchwabAPI("MAIN_DATA")
+            chains = await api.get_chains_sharded('$SPX', 8, 30, 200)
+        """
+        windows = [w for w in np.array_split(np.arange(fromDTE, toDTE + 1), shards) if len(w)]
+        if len(windows) <= 1:
+            return await self.get_chains(symbol, fromDTE, toDTE, strikeCount)
+
+        results = await asyncio.gather(*(
+            self.get_chains(symbol, int(w[0]), int(w[-1]), strikeCount) for w in windows
+        ))
+
+        for result in results:
+            if not result or "fault" in result:
+                return result or None
+
+        # Other fields (underlying, status, ...) describe the whole chain; take the first
+        merged = dict(results[0])
+        for key in ("callExpDateMap", "putExpDateMap"):
+            merged[key] = {exp: strikes for r in results for exp, strikes in r.get(key, {}).items()}
+        if "numberOfContracts" in merged:
+            merged["numberOfContracts"] = sum(r.get("numberOfContracts", 0) for r in results)
+        return merged
 
 
+def account_balance_sections(account_data: dict) -> tuple[Optional[dict], Optional[dict]]:
+    """
+    Return the securitiesAccount and currentBalances sections of an account response.
+
+    Indexes the nested keys directly instead of chaining .get(key, {}) calls,
+    which build a throwaway empty dict at every level.
+
+    Args:
+        account_data (dict): Response from SchwabAPI.get_account_balance()
+
+    Returns:
+        tuple[Optional[dict], Optional[dict]]: (securitiesAccount, currentBalances),
+            or (None, None) if either section is missing
+
+    Example:
+        account_info, balance_info = account_balance_sections(account_data)
+        if balance_info is not None:
+            buying_power = balance_info["dayTradingBuyingPower"]
+    """
+    try:
+        account_info = account_data["securitiesAccount"]
+        return account_info, account_info["currentBalances"]
+    except (KeyError, TypeError):
+        return None, None
+
 def generate_spxw_symbols(
     spx_price: float,
     range_width: float = 100,
@@ -1191,11 +1850,12 @@ def generate_spxw_symbols(
     low = math.floor((spx_price - range_width) / strike_step) * strike_step
     high = math.ceil((spx_price + range_width) / strike_step) * strike_step
 
-    symbols: List[str] = []
     steps = int((high - low) / strike_step) + 1
-    for i in range(steps):
-        strike = low + i * strike_step
-        code = str(int(strike * 1000)).zfill(8)
-        for cp in ("C", "P"):
-            symbols.append(f"SPXW  {exp_code}{cp}{code}")
-    return symbols
+    strikes = ((low + np.arange(steps) * strike_step) * 1000).astype(np.int64)
+    codes = np.char.zfill(strikes.astype(str), 8)
+
+    # Interleave call/put per strike: [C0, P0, C1, P1, ...]
+    prefix = f"SPXW  {exp_code}"
+    calls = np.char.add(prefix + "C", codes)
+    puts = np.char.add(prefix + "P", codes)
+    return np.column_stack((calls, puts)).ravel().tolist()
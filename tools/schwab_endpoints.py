@@ -10,11 +10,12 @@ Schwab API Structure:
 - Trading: https://api.schwabapi.com/trader/v1 (for accounts, orders, preferences, etc.)
 """
 
+import functools
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True)
 class SchwabEndpoints:
     """
     Centralized configuration for Schwab API endpoints.
@@ -23,95 +24,84 @@ class SchwabEndpoints:
     and endpoint mappings, eliminating confusion between OAuth and API operations.
 
     Base URLs are static and controlled by Schwab - no environment overrides needed.
+    Fixed endpoint URLs are built once in __post_init__ and read as plain
+    attributes; per-account URLs are methods memoized by argument.
     """
 
     # Base URLs - static and controlled by Schwab
     OAUTH_BASE_URL: str = "https://api.schwabapi.com/v1"
     MARKET_DATA_BASE_URL: str = "https://api.schwabapi.com/marketdata/v1" 
     TRADING_BASE_URL: str = "https://api.schwabapi.com/trader/v1"
-    
 
-    
     # OAuth Endpoints (always use OAUTH_BASE_URL)
-    @property
-    def oauth_authorize(self) -> str:
-        """OAuth authorization endpoint."""
-        return f"{self.OAUTH_BASE_URL}/oauth/authorize"
-    
-    @property 
-    def oauth_token(self) -> str:
-        """OAuth token endpoint."""
-        return f"{self.OAUTH_BASE_URL}/oauth/token"
-    
+    oauth_authorize: str = field(init=False)        # OAuth authorization endpoint
+    oauth_token: str = field(init=False)            # OAuth token endpoint
+
     # Market Data Endpoints (use MARKET_DATA_BASE_URL)
-    @property
-    def quotes(self) -> str:
-        """Get quotes by list of symbols."""
-        return f"{self.MARKET_DATA_BASE_URL}/quotes"
+    quotes: str = field(init=False)                 # Get quotes by list of symbols
+    option_quotes: str = field(init=False)          # Quotes for option symbols (same endpoint)
+    option_chains: str = field(init=False)          # Get option chain for an optionable symbol
+    option_expiration_chain: str = field(init=False)  # Get option expiration chain
+    price_history: str = field(init=False)          # Get price history for a single symbol
+    market_hours: str = field(init=False)           # Get market hours for different markets
+    instruments: str = field(init=False)            # Get instruments by symbols and projections
 
+    # Trading Endpoints (use TRADING_BASE_URL)
+    account_numbers: str = field(init=False)        # Account numbers and their encrypted values
+    accounts: str = field(init=False)               # Linked account(s) balances and positions
+    all_orders: str = field(init=False)             # Get all orders for all accounts
+    user_preferences: str = field(init=False)       # User preference information
+
+    def __post_init__(self):
+        urls = {
+            'oauth_authorize': f"{self.OAUTH_BASE_URL}/oauth/authorize",
+            'oauth_token': f"{self.OAUTH_BASE_URL}/oauth/token",
+            'quotes': f"{self.MARKET_DATA_BASE_URL}/quotes",
+            'option_quotes': f"{self.MARKET_DATA_BASE_URL}/quotes",
+            'option_chains': f"{self.MARKET_DATA_BASE_URL}/chains",
+            'option_expiration_chain': f"{self.MARKET_DATA_BASE_URL}/expirationchain",
+            'price_history': f"{self.MARKET_DATA_BASE_URL}/pricehistory",
+            'market_hours': f"{self.MARKET_DATA_BASE_URL}/markets",
+            'instruments': f"{self.MARKET_DATA_BASE_URL}/instruments",
+            'account_numbers': f"{self.TRADING_BASE_URL}/accounts/accountNumbers",
+            'accounts': f"{self.TRADING_BASE_URL}/accounts",
+            'all_orders': f"{self.TRADING_BASE_URL}/orders",
+            'user_preferences': f"{self.TRADING_BASE_URL}/userPreference",
+        }
+        for name, url in urls.items():
+            object.__setattr__(self, name, url)
+
+    # Market Data Endpoints with path parameters
     def quote_by_symbol(self, symbol: str) -> str:
         """Get quote by single symbol."""
         return f"{self.MARKET_DATA_BASE_URL}/{symbol}/quotes"
 
-    @property
-    def option_chains(self) -> str:
-        """Get option chain for an optionable symbol."""
-        return f"{self.MARKET_DATA_BASE_URL}/chains"
-
-    @property
-    def option_expiration_chain(self) -> str:
-        """Get option expiration chain for an optionable symbol."""
-        return f"{self.MARKET_DATA_BASE_URL}/expirationchain"
-
-    @property
-    def price_history(self) -> str:
-        """Get price history for a single symbol and date ranges."""
-        return f"{self.MARKET_DATA_BASE_URL}/pricehistory"
-
     def movers(self, symbol_id: str) -> str:
         """Get movers for a specific index."""
         return f"{self.MARKET_DATA_BASE_URL}/movers/{symbol_id}"
 
-    @property
-    def market_hours(self) -> str:
-        """Get market hours for different markets."""
-        return f"{self.MARKET_DATA_BASE_URL}/markets"
-
     def market_hours_by_id(self, market_id: str) -> str:
         """Get market hours for a single market."""
         return f"{self.MARKET_DATA_BASE_URL}/markets/{market_id}"
 
-    @property
-    def instruments(self) -> str:
-        """Get instruments by symbols and projections."""
-        return f"{self.MARKET_DATA_BASE_URL}/instruments"
-
     def instrument_by_cusip(self, cusip_id: str) -> str:
         """Get instrument by specific cusip."""
         return f"{self.MARKET_DATA_BASE_URL}/instruments/{cusip_id}"
-    
-    # Trading Endpoints (use TRADING_BASE_URL)
-    @property
-    def account_numbers(self) -> str:
-        """Get list of account numbers and their encrypted values."""
-        return f"{self.TRADING_BASE_URL}/accounts/accountNumbers"
-
-    @property
-    def accounts(self) -> str:
-        """Get linked account(s) balances and positions for the logged in user."""
-        return f"{self.TRADING_BASE_URL}/accounts"
 
+    # Trading Endpoints with path parameters (account hashes are few, so cache)
+    @functools.lru_cache(maxsize=256)
     def account_by_number(self, account_number: str) -> str:
         """Get a specific account balance and positions for the logged in user."""
         return f"{self.TRADING_BASE_URL}/accounts/{account_number}"
 
+    @functools.lru_cache(maxsize=256)
     def account_orders(self, account_number: str) -> str:
         """Get all orders for a specific account."""
         return f"{self.TRADING_BASE_URL}/accounts/{account_number}/orders"
 
     def place_order(self, account_number: str) -> str:
         """Place order for a specific account."""
-        return f"{self.TRADING_BASE_URL}/accounts/{account_number}/orders"
+        return self.account_orders(account_number)
 
     def get_order(self, account_number: str, order_id: str) -> str:
         """Get a specific order by its ID, for a specific account."""
@@ -125,15 +115,11 @@ class SchwabEndpoints:
         """Replace order for a specific account."""
         return f"{self.TRADING_BASE_URL}/accounts/{account_number}/orders/{order_id}"
 
-    @property
-    def all_orders(self) -> str:
-        """Get all orders for all accounts."""
-        return f"{self.TRADING_BASE_URL}/orders"
-
     def preview_order(self, account_number: str) -> str:
         """Preview order for a specific account."""
         return f"{self.TRADING_BASE_URL}/accounts/{account_number}/previewOrder"
 
+    @functools.lru_cache(maxsize=256)
     def account_transactions(self, account_number: str) -> str:
         """Get all transactions information for a specific account."""
         return f"{self.TRADING_BASE_URL}/accounts/{account_number}/transactions"
@@ -142,11 +128,6 @@ class SchwabEndpoints:
         """Get specific transaction information for a specific account."""
         return f"{self.TRADING_BASE_URL}/accounts/{account_number}/transactions/{transaction_id}"
 
-    @property
-    def user_preferences(self) -> str:
-        """Get user preference information for the logged in user."""
-        return f"{self.TRADING_BASE_URL}/userPreference"
-
 # Global instance for easy access
 SCHWAB_ENDPOINTS = SchwabEndpoints()
 
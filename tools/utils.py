@@ -8,15 +8,188 @@ Features:
 - Date/time parsing from various string formats
 - Timezone conversion to Pacific Time
 - Epoch timestamp conversion utilities
+- Vectorized batch conversion for whole columns of timestamps
 
 Dependencies:
 - datetime: For date/time operations
 - zoneinfo: For timezone handling (Python 3.9+)
+- numpy/pandas: For batch conversions
 """
 
-from datetime import datetime, timezone
+import re
+import sys
+import functools
+from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
-from typing import Union
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    # Optional: C ISO 8601 parser, faster than datetime.fromisoformat
+    from ciso8601 import parse_datetime as _ciso_parse
+except ImportError:
+    _ciso_parse = None
+
+try:
+    # Strict ISO 8601 parser (installed with pandas); covers basic-format and
+    # week dates before the strptime formats are tried
+    from dateutil.parser import isoparse as _isoparse
+except ImportError:
+    _isoparse = None
+
+__all__ = [
+    "PACIFIC_TZ",
+    "parse_date",
+    "convert_to_pacific_time",
+    "convert_epoch_to_pacific",
+    "convert_to_pacific_batch",
+    "convert_epoch_to_pacific_batch",
+    "convert_epoch_to_pacific_bulk",
+    "get_current_pacific_time",
+    "format_time_for_db",
+    "get_dte_date",
+    "get_dte_date_str",
+]
+
+# Pacific timezone, built once and shared by all conversions
+PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+
+# Parser entry points bound once, saving an attribute lookup per parse
+_fromisoformat = datetime.fromisoformat
+_strptime = datetime.strptime
+
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 on
+_ISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+
+# Formats tried by parse_date when datetime.fromisoformat rejects a string
+_DATE_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S%z',      # ISO 8601 with timezone offset
+    '%Y-%m-%dT%H:%M:%S.%f%z',   # ISO 8601 with microseconds and timezone
+    '%Y-%m-%dT%H:%M:%SZ',       # ISO 8601 with Z (UTC)
+    '%Y-%m-%dT%H:%M:%S.%fZ',    # ISO 8601 with microseconds and Z
+    '%Y-%m-%dT%H:%M:%S',        # ISO 8601 without timezone
+    '%Y-%m-%dT%H:%M:%S.%f',     # ISO 8601 with microseconds, no timezone
+    '%Y-%m-%d %H:%M:%S',        # Standard datetime format
+    '%Y-%m-%d',                 # Date only
+)
+
+
+# ISO 8601 layouts parse_date understands, in one pass: date, optional time
+# with fractional seconds, optional 'Z' or +HH:MM / +HHMM offset
+_ISO_RE = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:?\d{2})?)?'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _fixed_offset(minutes: int) -> timezone:
+    """
+    Return a shared fixed-offset tzinfo for an offset in minutes.
+
+    Schwab timestamps carry a couple of distinct offsets (-05:00/-04:00), so
+    interning them saves building a timezone per parsed string. The cache is
+    bounded by the valid offset range (under 2880 entries).
+
+    Args:
+        minutes (int): UTC offset in minutes (e.g. -300 for -05:00)
+
+    Returns:
+        timezone: timezone.utc for 0, otherwise a fixed-offset timezone
+    """
+    return timezone(timedelta(minutes=minutes))
+
+
+def _parse_iso_match(m: re.Match) -> datetime:
+    """
+    Build a datetime from an _ISO_RE match.
+
+    Args:
+        m (re.Match): Full match of _ISO_RE
+
+    Returns:
+        datetime: Parsed datetime, UTC when the string has no offset
+
+    Raises:
+        ValueError: If a field is out of range (e.g. month 13)
+    """
+    year, month, day, hour, minute, second, fraction, offset = m.groups()
+    if offset is None or offset == 'Z':
+        tz = timezone.utc
+    else:
+        minutes = int(offset[1:3]) * 60 + int(offset[-2:])
+        tz = _fixed_offset(-minutes if offset[0] == '-' else minutes)
+    if hour is None:
+        return datetime(int(year), int(month), int(day), tzinfo=tz)
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                    int(fraction.ljust(6, '0')) if fraction else 0, tzinfo=tz)
+
+
+def _fmt_db(dt: datetime) -> str:
+    """Format a datetime's wall-clock fields as 'YYYY-MM-DD HH:MM:SS' (cheaper than strftime)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+@functools.lru_cache(maxsize=512)
+def _pacific_offset(utc_hour: int) -> timedelta:
+    """
+    Return the Pacific UTC offset in effect during a UTC hour.
+
+    Pacific DST switches happen on the hour, so one lookup in the zone's
+    transition table covers every timestamp in that hour; a trading day of
+    data resolves to a handful of cached entries.
+
+    Args:
+        utc_hour (int): Hours since the Unix epoch (epoch seconds // 3600)
+
+    Returns:
+        timedelta: Offset to add to UTC wall time (-8h for PST, -7h for PDT)
+    """
+    return datetime.fromtimestamp(utc_hour * 3600, PACIFIC_TZ).utcoffset()
+
+
+def _utc_to_pacific_wall(utc_dt: datetime) -> datetime:
+    """
+    Convert a UTC datetime to naive Pacific wall-clock time.
+
+    Adds the cached offset for the datetime's hour instead of running
+    astimezone(), which searches the zone's transitions on every call.
+
+    Args:
+        utc_dt (datetime): Datetime whose tzinfo is timezone.utc
+
+    Returns:
+        datetime: Naive datetime holding the Pacific wall-clock fields
+    """
+    return utc_dt.replace(tzinfo=None) + _pacific_offset(int(utc_dt.timestamp() // 3600))
+
+
+def _strptime_format(date_string: str) -> str:
+    """
+    Build the one strptime format a date string's shape allows.
+
+    Decided from the separator, a fractional part and an offset, so a
+    well-formed string needs a single strptime call instead of a series of
+    failing attempts.
+
+    Args:
+        date_string (str): Stripped date string
+
+    Returns:
+        str: strptime format (e.g. '%Y-%m-%dT%H:%M:%S.%f%z')
+    """
+    if 'T' not in date_string and ' ' not in date_string:
+        return '%Y-%m-%d'
+    fmt = '%Y-%m-%dT%H:%M:%S' if 'T' in date_string else '%Y-%m-%d %H:%M:%S'
+    time_part = date_string[10:]
+    if '.' in time_part:
+        fmt += '.%f'
+    if time_part.endswith('Z') or '+' in time_part or '-' in time_part:
+        fmt += '%z'
+    return fmt
 
 
 def parse_date(date_string: str) -> datetime:
@@ -44,44 +217,90 @@ def parse_date(date_string: str) -> datetime:
         - ISO 8601 with Z (UTC): '2024-12-18T09:30:00Z'
         - ISO 8601 without timezone: '2024-12-18T09:30:00'
         - Date only: '2024-12-18'
+        ISO strings are parsed with ciso8601 when it is installed, otherwise
+        with datetime.fromisoformat; variants those reject (e.g. '+0000'
+        offsets on older Pythons) go through a precompiled regex, then
+        dateutil's isoparse, and the strptime formats are only tried as a
+        last resort.
+
+    Note:
+        Results are memoized by the stripped input string (LRU, 4096 entries),
+        so padded and unpadded copies share one entry; the returned datetime
+        is immutable so sharing it between callers is safe. Inspect or reset
+        the cache through _parse_date_cached.cache_info() / cache_clear().
     """
     # Remove any whitespace
-    date_string = date_string.strip()
-    
-    # List of common date formats to try
-    formats = [
-        '%Y-%m-%dT%H:%M:%S%z',      # ISO 8601 with timezone offset
-        '%Y-%m-%dT%H:%M:%S.%f%z',   # ISO 8601 with microseconds and timezone
-        '%Y-%m-%dT%H:%M:%SZ',       # ISO 8601 with Z (UTC)
-        '%Y-%m-%dT%H:%M:%S.%fZ',    # ISO 8601 with microseconds and Z
-        '%Y-%m-%dT%H:%M:%S',        # ISO 8601 without timezone
-        '%Y-%m-%dT%H:%M:%S.%f',     # ISO 8601 with microseconds, no timezone
-        '%Y-%m-%d %H:%M:%S',        # Standard datetime format
-        '%Y-%m-%d',                 # Date only
-    ]
-    
-    # Handle 'Z' suffix by replacing with '+00:00'
-    if date_string.endswith('Z'):
+    return _parse_date_cached(date_string.strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_string: str) -> datetime:
+    """Parse an already-stripped date string (see parse_date)."""
+    # Handle 'Z' suffix by replacing with '+00:00' (older Pythons only)
+    if not _ISO_HANDLES_Z and date_string.endswith('Z'):
         date_string = date_string[:-1] + '+00:00'
-    
-    # Try each format
-    for fmt in formats:
+
+    # Fastest path: ciso8601 when installed
+    if _ciso_parse is not None:
+        try:
+            dt = _ciso_parse(date_string)
+        except ValueError:
+            pass
+        else:
+            return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+    # Fast path: ISO 8601 strings go through the C-implemented parser
+    try:
+        dt = _fromisoformat(date_string)
+    except ValueError:
+        pass
+    else:
+        # If no timezone info, assume UTC
+        return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+    # ISO variants fromisoformat rejects (e.g. '+0000' offsets on older
+    # Pythons): one regex pass instead of a series of strptime attempts
+    m = _ISO_RE.fullmatch(date_string)
+    if m is not None:
         try:
-            dt = datetime.strptime(date_string, fmt)
-            
-            # If no timezone info, assume UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            
-            return dt
+            return _parse_iso_match(m)
         except ValueError:
-            continue
+            pass
+
+    # Remaining ISO 8601 forms (e.g. '20241218T093000'): one strict parse
+    if _isoparse is not None:
+        try:
+            dt = _isoparse(date_string)
+        except ValueError:
+            pass
+        else:
+            return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+    # Last resort: strptime with the format the string's shape calls for
+    try:
+        dt = _strptime(date_string, _strptime_format(date_string))
+    except ValueError:
+        dt = None
+
+    # Only malformed strings get here: probe the full format list
+    if dt is None:
+        for fmt in _DATE_FORMATS:
+            try:
+                dt = _strptime(date_string, fmt)
+                break
+            except ValueError:
+                continue
+
+    if dt is not None:
+        # If no timezone info, assume UTC
+        return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
     
     # If no format worked, raise an error
     raise ValueError(f"Unable to parse date string: '{date_string}'. "
                    f"Supported formats include ISO 8601 variants and standard datetime formats.")
 
 
+@functools.lru_cache(maxsize=4096)
 def convert_to_pacific_time(dt: Union[datetime, str]) -> str:
     """
     Convert a datetime object or string to Pacific Time and return as formatted string.
@@ -109,17 +328,21 @@ def convert_to_pacific_time(dt: Union[datetime, str]) -> str:
     Note:
         If input is a string, it will be parsed using parse_date() first.
         The output format is always 'YYYY-MM-DD HH:MM:SS' without timezone suffix.
+        Results are memoized, since order payloads repeat the same timestamps.
     """
     # If input is a string, parse it first
     if isinstance(dt, str):
         dt = parse_date(dt)
     
-    # Convert to Pacific timezone
-    pacific_tz = ZoneInfo("US/Pacific")
-    pacific_dt = dt.astimezone(pacific_tz)
+    # Schwab timestamps are UTC: go straight to Pacific wall time
+    if dt.tzinfo is timezone.utc:
+        return _fmt_db(_utc_to_pacific_wall(dt))
+
+    # Convert to Pacific timezone (skipped when it already is)
+    pacific_dt = dt if dt.tzinfo is PACIFIC_TZ else dt.astimezone(PACIFIC_TZ)
     
     # Return formatted string without timezone suffix
-    return pacific_dt.strftime('%Y-%m-%d %H:%M:%S')
+    return _fmt_db(pacific_dt)
 
 
 def convert_epoch_to_pacific(epoch_timestamp: Union[int, float]) -> str:
@@ -137,21 +360,106 @@ def convert_epoch_to_pacific(epoch_timestamp: Union[int, float]) -> str:
 
     Example:
         pacific_str = convert_epoch_to_pacific(1703001000)
-        print(pacific_str)  # '2023-12-19 08:36:40'
+        print(pacific_str)  # '2023-12-19 07:50:00'
 
     Note:
         The output format is always 'YYYY-MM-DD HH:MM:SS' without timezone suffix.
         Input timestamp is assumed to be in UTC (standard Unix timestamp).
+        This is already the fused epoch -> DB string path (one datetime, a
+        cached offset, no tz conversion); ETL writers can call it directly.
+        Use convert_epoch_to_pacific_batch/_bulk for whole columns.
     """
-    # Create datetime object from epoch timestamp (UTC)
-    utc_dt = datetime.fromtimestamp(epoch_timestamp, tz=timezone.utc)
-    
-    # Convert to Pacific timezone
-    pacific_tz = ZoneInfo("US/Pacific")
-    pacific_dt = utc_dt.astimezone(pacific_tz)
+    # Shift the epoch by the (cached) Pacific offset, so the UTC fields of the
+    # resulting datetime are the Pacific wall-clock fields
+    offset = _pacific_offset(int(epoch_timestamp // 3600)).total_seconds()
+    pacific_dt = datetime.fromtimestamp(epoch_timestamp + offset, tz=timezone.utc)
     
     # Return formatted string without timezone suffix
-    return pacific_dt.strftime('%Y-%m-%d %H:%M:%S')
+    return _fmt_db(pacific_dt)
+
+
+def convert_to_pacific_batch(date_strings: Iterable[str]) -> np.ndarray:
+    """
+    Convert many ISO 8601 date strings to Pacific Time strings in one pass.
+
+    Vectorized counterpart of convert_to_pacific_time() for whole columns:
+    the strings are parsed and converted by pandas rather than one Python
+    call per value.
+
+    Args:
+        date_strings (Iterable[str]): ISO 8601 date strings (naive strings are taken as UTC)
+
+    Returns:
+        np.ndarray: Object array of 'YYYY-MM-DD HH:MM:SS' Pacific strings,
+            None where the input was missing
+
+    Raises:
+        ValueError: If a string is not ISO 8601
+
+    Example:
+        convert_to_pacific_batch(['2024-12-18T14:30:00Z', '2024-12-18T15:00:00Z'])
+        # array(['2024-12-18 06:30:00', '2024-12-18 07:00:00'], dtype=object)
+    """
+    return _format_pacific(pd.to_datetime(list(date_strings), utc=True, format='ISO8601'))
+
+
+def convert_epoch_to_pacific_batch(epoch_timestamps: Iterable[Optional[Union[int, float]]],
+                                   unit: str = 's') -> np.ndarray:
+    """
+    Convert many Unix epoch timestamps to Pacific Time strings in one pass.
+
+    Vectorized counterpart of convert_epoch_to_pacific() for whole columns.
+
+    Args:
+        epoch_timestamps (Iterable): Unix timestamps; None entries stay None
+        unit (str): Timestamp unit, 's' (default) or 'ms' for Schwab's *InLong fields
+
+    Returns:
+        np.ndarray: Object array of 'YYYY-MM-DD HH:MM:SS' Pacific strings
+
+    Example:
+        convert_epoch_to_pacific_batch([1703001000000, None], unit='ms')
+        # array(['2023-12-19 07:50:00', None], dtype=object)
+    """
+    return _format_pacific(pd.to_datetime(list(epoch_timestamps), unit=unit, utc=True))
+
+
+def convert_epoch_to_pacific_bulk(epoch_seconds: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of Unix epoch seconds to Pacific Time byte strings.
+
+    Bulk path for tick/quote backfills: integer NumPy arithmetic throughout,
+    with no per-element Python calls. Each distinct UTC hour resolves its
+    offset once through the cached _pacific_offset(), the shifted epochs are
+    rendered by numpy.datetime_as_string, and the 'T' separator is patched
+    to a space in place.
+
+    Args:
+        epoch_seconds (np.ndarray): Whole Unix timestamps in seconds (int64;
+            fractional values are truncated, missing values are not allowed)
+
+    Returns:
+        np.ndarray: Fixed-width '|S19' array of b'YYYY-MM-DD HH:MM:SS' values
+
+    Example:
+        convert_epoch_to_pacific_bulk(np.array([1703001000, 1719853200]))
+        # array([b'2023-12-19 07:50:00', b'2024-07-01 10:00:00'], dtype='|S19')
+    """
+    epochs = np.asarray(epoch_seconds, dtype=np.int64).ravel()
+    hours, inverse = np.unique(epochs // 3600, return_inverse=True)
+    offsets = np.array([_pacific_offset(int(h)).total_seconds() for h in hours], dtype=np.int64)
+    local = (epochs + offsets[inverse.ravel()]).astype('datetime64[s]')
+
+    formatted = np.datetime_as_string(local, unit='s').astype('S19')
+    formatted.view(np.uint8).reshape(-1, 19)[:, 10] = ord(' ')
+    return formatted
+
+
+def _format_pacific(utc_index: pd.DatetimeIndex) -> np.ndarray:
+    """Format a UTC DatetimeIndex as Pacific 'YYYY-MM-DD HH:MM:SS' strings, NaT as None."""
+    formatted = utc_index.tz_convert(PACIFIC_TZ).strftime('%Y-%m-%d %H:%M:%S').to_numpy(dtype=object)
+    formatted[utc_index.isna()] = None
+    return formatted
 
 
 def get_current_pacific_time() -> datetime:
@@ -165,8 +473,7 @@ def get_current_pacific_time() -> datetime:
         now_pacific = get_current_pacific_time()
         print(now_pacific)  # 2024-12-18 06:30:00-08:00
     """
-    pacific_tz = ZoneInfo("US/Pacific")
-    return datetime.now(pacific_tz)
+    return datetime.now(PACIFIC_TZ)
 
 
 def format_time_for_db(dt: datetime) -> str:
@@ -187,13 +494,17 @@ def format_time_for_db(dt: datetime) -> str:
         dt = datetime.now()
         db_str = format_time_for_db(dt)
         print(db_str)  # '2024-12-18 14:30:45'
+
+    Note:
+        The DB formatters return str on purpose: pyodbc binds bytes as
+        VARBINARY, which SQL Server will not implicitly convert to DATETIME2.
+        convert_epoch_to_pacific_bulk() returns bytes for non-SQL sinks.
     """
-    # Remove microseconds and timezone info for clean database storage
-    clean_dt = dt.replace(microsecond=0, tzinfo=None)
-    return clean_dt.strftime('%Y-%m-%d %H:%M:%S')
+    # Microseconds and timezone info are left out by formatting only the wall-clock fields
+    return _fmt_db(dt)
 
 
-def get_dte_date(dte: int):
+def get_dte_date(dte: int) -> date:
     """
     Calculate a date based on Days To Expiration (DTE).
 
@@ -219,6 +530,26 @@ def get_dte_date(dte: int):
         This function is primarily used for Schwab API option chains requests
         where date ranges are specified using days to expiration.
     """
-    from datetime import date, timedelta
+    return date.today() + timedelta(days=dte)
+
+
+def get_dte_date_str(dte: int) -> str:
+    """
+    Return get_dte_date(dte) as a 'YYYY-MM-DD' string.
+
+    Args:
+        dte (int): Days to expiration from today
+
+    Returns:
+        str: ISO date string (e.g. '2024-12-25')
+
+    Note:
+        Memoized per (today, dte), so a long-running poller formats each date
+        once per day; keying on today's date keeps results correct across midnight.
+    """
+    return _dte_date_str(date.today(), dte)
+
 
-    return (date.today() + timedelta(days=dte))
+@functools.lru_cache(maxsize=128)
+def _dte_date_str(today: date, dte: int) -> str:
+    return (today + timedelta(days=dte)).isoformat()